@@ -22,7 +22,9 @@ from sklearn.ensemble import IsolationForest
 import openai
 
 from ..config.production_config import get_config
-from ..data_management.petastorm_pipeline import get_ml_pipeline, ESGDataPoint
+from ..data_management.petastorm_pipeline import (
+    get_ml_pipeline, ingest_esg_data, ESGDataPoint
+)
 from ..validation.production_validator import get_validator
 from ..ai.mcp_integration import get_mcp_ai_interface
 
@@ -819,31 +821,49 @@ class AdaptiveQualityController:
             return []
     
     def _extract_anomaly_features(self, data_points: List[ESGDataPoint]) -> np.ndarray:
-        """Extract numerical features for anomaly detection."""
-        features = []
-        
-        for point in data_points:
-            feature_vector = [
-                point.environmental_score,
-                point.social_score,
-                point.governance_score,
-                point.combined_score,
-                point.data_quality_score,
-                point.confidence_score
-            ]
-            
-            # Add optional features if available
-            if point.carbon_intensity is not None:
-                feature_vector.append(point.carbon_intensity)
-            if point.water_intensity is not None:
-                feature_vector.append(point.water_intensity)
-            if point.energy_efficiency is not None:
-                feature_vector.append(point.energy_efficiency)
-            
-            features.append(feature_vector)
-        
-        return np.array(features)
-    
+        """Extract numerical features for anomaly detection.
+
+        Builds the feature matrix column-wise (SoA) so each column is one
+        contiguous float64 fill instead of a per-point Python list append.
+        """
+        n = len(data_points)
+        columns = [
+            np.fromiter((p.environmental_score for p in data_points),
+                        np.float64, count=n),
+            np.fromiter((p.social_score for p in data_points),
+                        np.float64, count=n),
+            np.fromiter((p.governance_score for p in data_points),
+                        np.float64, count=n),
+            np.fromiter((p.combined_score for p in data_points),
+                        np.float64, count=n),
+            np.fromiter((p.data_quality_score for p in data_points),
+                        np.float64, count=n),
+            np.fromiter((p.confidence_score for p in data_points),
+                        np.float64, count=n),
+        ]
+
+        # Optional features join the matrix only when every point carries
+        # them, keeping the output rectangular
+        for attr in ('carbon_intensity', 'water_intensity', 'energy_efficiency'):
+            values = [getattr(point, attr) for point in data_points]
+            if values and all(value is not None for value in values):
+                columns.append(np.asarray(values, dtype=np.float64))
+
+        return np.column_stack(columns)
+
+    def _extract_anomaly_features_np(self, scores: np.ndarray) -> np.ndarray:
+        """Extract the anomaly feature matrix from a structured score array.
+
+        Fast path for callers that already hold scores column-wise in a
+        structured dtype (e.g. ``[('env', 'f8'), ('soc', 'f8'), ...]``):
+        each field is a contiguous float64 view, so building the matrix
+        is a pure column stack with no per-point attribute reads.
+        """
+        return np.column_stack(
+            [scores[name].astype(np.float64, copy=False)
+             for name in scores.dtype.names]
+        )
+
     async def _explain_anomaly(
         self, 
         data_point: ESGDataPoint, 
@@ -1043,19 +1063,21 @@ class AIDataManagementOrchestrator:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=30)
             
-            # Ingest from multiple sources
-            from ..data_management.petastorm_pipeline import ingest_esg_data
-            
+            # Ingest from all sources concurrently; each source is
+            # independent I/O, and one failing source must not stop the rest
+            sources = ['refinitiv', 'bloomberg']  # Available sources
+            ingest_results = await asyncio.gather(
+                *(ingest_esg_data(company_ids, start_date, end_date, [source])
+                  for source in sources),
+                return_exceptions=True
+            )
+
             data_by_source = {}
-            for source in ['refinitiv', 'bloomberg']:  # Available sources
-                try:
-                    source_data = await ingest_esg_data(
-                        company_ids, start_date, end_date, [source]
-                    )
-                    if source_data:
-                        data_by_source[source] = source_data
-                except Exception as e:
-                    logger.error(f"Error ingesting from {source}: {e}")
+            for source, source_data in zip(sources, ingest_results):
+                if isinstance(source_data, Exception):
+                    logger.error(f"Error ingesting from {source}: {source_data}")
+                elif source_data:
+                    data_by_source[source] = source_data
             
             total_ingested = sum(len(data) for data in data_by_source.values())
             cycle_results['ingestion_results'] = {
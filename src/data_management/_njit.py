@@ -0,0 +1,18 @@
+"""Optional Numba acceleration for numeric kernels.
+
+Exposes ``njit`` from numba when it is installed; otherwise a no-op
+decorator so the kernels run as plain Python over NumPy arrays. Callers
+import from here instead of depending on numba directly.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
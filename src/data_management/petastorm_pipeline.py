@@ -11,10 +11,12 @@ import logging
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union, Tuple, Iterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 import json
 import asyncio
@@ -23,6 +25,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import hashlib
 
+# orjson is optional; the stdlib encoder keeps the JSON helpers working
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Petastorm imports with fallback
 try:
     from petastorm import make_reader, make_batch_reader
@@ -40,13 +48,36 @@ except ImportError as e:
 from ..config.production_config import get_config
 from ..validation.production_validator import get_validator, validate_esg_data
 from .premium_data_connectors import get_premium_data_connector
+from ._njit import njit
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@njit(cache=True)
+def _dedup_kernel(group_ids: np.ndarray,
+                  quality: np.ndarray,
+                  n_groups: int) -> np.ndarray:
+    """Index of the highest-quality row per group, in group order.
+
+    Operates on plain int64/float64 arrays so Numba can compile it when
+    available; without Numba it runs as an ordinary Python loop.
+    """
+    best = np.full(n_groups, -1, dtype=np.int64)
+    for i in range(group_ids.shape[0]):
+        g = group_ids[i]
+        j = best[g]
+        if j == -1 or quality[i] > quality[j]:
+            best[g] = i
+    return best
+
+
+@dataclass(slots=True)
 class ESGDataPoint:
-    """Structured ESG data point for ML processing."""
+    """Structured ESG data point for ML processing.
+
+    Slotted so large ingests avoid a per-instance ``__dict__``; with 19
+    fields this roughly halves the per-point memory footprint.
+    """
     company_id: str
     timestamp: datetime
     data_source: str
@@ -91,6 +122,41 @@ class ESGDataPoint:
             'confidence_score': self.confidence_score
         }
 
+    def to_arrow_row(self) -> tuple:
+        """Row tuple in declared field order for columnar writers.
+
+        Skips dict construction and the timestamp isoformat round trip;
+        the timestamp stays a datetime for Arrow to encode natively.
+        """
+        return tuple(getattr(self, name) for name in _ESG_FIELD_ORDER)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, via orjson when it is installed.
+
+        orjson encodes datetimes natively, skipping the pure-Python
+        isoformat call that dominates to_dict for large batches.
+        """
+        if orjson is not None:
+            return orjson.dumps(dict(zip(_ESG_FIELD_ORDER, self.to_arrow_row())))
+        return json.dumps(self.to_dict()).encode()
+
+
+# Declared field order, resolved once instead of per to_arrow_row call
+_ESG_FIELD_ORDER = tuple(f.name for f in fields(ESGDataPoint))
+
+
+def batch_to_json(data: List[ESGDataPoint]) -> bytes:
+    """Serialize a batch of data points as one JSON array.
+
+    One encoder pass over all rows; API handlers can return the bytes
+    directly instead of jsonify-ing a list of per-point dicts.
+    """
+    rows = [dict(zip(_ESG_FIELD_ORDER, data_point.to_arrow_row()))
+            for data_point in data]
+    if orjson is not None:
+        return orjson.dumps(rows)
+    return json.dumps(rows, default=str).encode()
+
 
 # Petastorm Unischema for ESG data
 if PETASTORM_AVAILABLE:
@@ -119,6 +185,42 @@ else:
     ESGUnischema = None
 
 
+# Schema introspection resolved once at import: column order for Spark
+# selects, a frozenset for O(1) membership checks, and a dtype lookup
+if PETASTORM_AVAILABLE:
+    _SCHEMA_COLUMNS = tuple(f.name for f in ESGUnischema.fields)
+    _ESG_FIELD_NAMES = frozenset(_SCHEMA_COLUMNS)
+    _ESG_FIELD_TYPES = {f.name: f.numpy_dtype for f in ESGUnischema.fields}
+else:
+    _SCHEMA_COLUMNS = ()
+    _ESG_FIELD_NAMES = frozenset()
+    _ESG_FIELD_TYPES = {}
+
+
+# Arrow schema mirroring ESGUnischema, used by the Parquet fallback path
+PYARROW_SCHEMA = pa.schema([
+    ('company_id', pa.string()),
+    ('timestamp', pa.timestamp('ns')),
+    ('data_source', pa.string()),
+    ('environmental_score', pa.float32()),
+    ('social_score', pa.float32()),
+    ('governance_score', pa.float32()),
+    ('combined_score', pa.float32()),
+    ('carbon_intensity', pa.float32()),
+    ('water_intensity', pa.float32()),
+    ('waste_intensity', pa.float32()),
+    ('energy_efficiency', pa.float32()),
+    ('employee_satisfaction', pa.float32()),
+    ('board_diversity', pa.float32()),
+    ('revenue', pa.float64()),
+    ('market_cap', pa.float64()),
+    ('sector', pa.string()),
+    ('region', pa.string()),
+    ('data_quality_score', pa.float32()),
+    ('confidence_score', pa.float32()),
+])
+
+
 class DataIngestionAdapter:
     """Abstract base class for data source adapters."""
     
@@ -138,24 +240,33 @@ class DataIngestionAdapter:
             'refill_rate': self.config.get('rate_limit', 100) / 60.0  # per second
         }
     
-    def _check_rate_limit(self) -> bool:
-        """Check if request is within rate limits."""
+    def _refill(self) -> None:
+        """Credit tokens accrued since the last refill."""
         now = time.time()
         time_passed = now - self.rate_limiter['last_refill']
-        
-        # Refill tokens
-        tokens_to_add = time_passed * self.rate_limiter['refill_rate']
+
         self.rate_limiter['tokens'] = min(
             self.rate_limiter['max_tokens'],
-            self.rate_limiter['tokens'] + tokens_to_add
+            self.rate_limiter['tokens'] + time_passed * self.rate_limiter['refill_rate']
         )
         self.rate_limiter['last_refill'] = now
-        
-        # Check if we have tokens
-        if self.rate_limiter['tokens'] >= 1:
-            self.rate_limiter['tokens'] -= 1
+
+    def _consume(self, n: int = 1) -> bool:
+        """Take ``n`` tokens from the bucket in one step if available.
+
+        Burst ingestion can reserve a whole batch with a single clock
+        read instead of checking the limit once per request.
+        """
+        self._refill()
+
+        if self.rate_limiter['tokens'] >= n:
+            self.rate_limiter['tokens'] -= n
             return True
         return False
+
+    def _check_rate_limit(self) -> bool:
+        """Check if request is within rate limits."""
+        return self._consume(1)
     
     async def ingest_data(self, company_ids: List[str], 
                          start_date: datetime, 
@@ -203,7 +314,10 @@ class RefinitivAdapter(DataIngestionAdapter):
                          end_date: datetime) -> List[ESGDataPoint]:
         """Ingest ESG data from Refinitiv."""
         data_points = []
-        
+
+        # One clock read per batch; every point in this ingest run shares it
+        batch_timestamp = datetime.now()
+
         for company_id in company_ids:
             if not self._check_rate_limit():
                 await asyncio.sleep(1)  # Wait if rate limited
@@ -216,7 +330,7 @@ class RefinitivAdapter(DataIngestionAdapter):
                 # Convert to ESGDataPoint
                 data_point = ESGDataPoint(
                     company_id=company_id,
-                    timestamp=datetime.now(),
+                    timestamp=batch_timestamp,
                     data_source="refinitiv",
                     environmental_score=esg_data['esg_scores']['environmental'],
                     social_score=esg_data['esg_scores']['social'],
@@ -253,7 +367,10 @@ class BloombergAdapter(DataIngestionAdapter):
                          end_date: datetime) -> List[ESGDataPoint]:
         """Ingest ESG data from Bloomberg."""
         data_points = []
-        
+
+        # One clock read per batch; every point in this ingest run shares it
+        batch_timestamp = datetime.now()
+
         for company_id in company_ids:
             if not self._check_rate_limit():
                 await asyncio.sleep(1)
@@ -264,7 +381,7 @@ class BloombergAdapter(DataIngestionAdapter):
                 
                 data_point = ESGDataPoint(
                     company_id=company_id,
-                    timestamp=datetime.now(),
+                    timestamp=batch_timestamp,
                     data_source="bloomberg",
                     environmental_score=esg_data['esg_scores']['environmental'],
                     social_score=esg_data['esg_scores']['social'],
@@ -350,23 +467,22 @@ class PetastormMLPipeline:
             sources = list(self.adapters.keys())
         
         all_data = []
-        
-        # Create tasks for concurrent ingestion
-        tasks = []
-        for source_name in sources:
-            if source_name in self.adapters:
-                adapter = self.adapters[source_name]
-                task = adapter.ingest_data(company_ids, start_date, end_date)
-                tasks.append((source_name, task))
-        
-        # Execute tasks concurrently
-        for source_name, task in tasks:
-            try:
-                source_data = await task
+
+        # Fan out to all sources at once so total wall time is the
+        # slowest source, not the sum; exceptions are captured per source
+        source_names = [name for name in sources if name in self.adapters]
+        results = await asyncio.gather(
+            *(self.adapters[name].ingest_data(company_ids, start_date, end_date)
+              for name in source_names),
+            return_exceptions=True
+        )
+
+        for source_name, source_data in zip(source_names, results):
+            if isinstance(source_data, Exception):
+                logger.error(f"Failed to ingest data from {source_name}: {source_data}")
+            else:
                 all_data.extend(source_data)
                 logger.info(f"Ingested {len(source_data)} data points from {source_name}")
-            except Exception as e:
-                logger.error(f"Failed to ingest data from {source_name}: {e}")
         
         # Deduplicate data (prefer higher quality scores)
         deduplicated_data = self._deduplicate_data(all_data)
@@ -376,20 +492,24 @@ class PetastormMLPipeline:
     
     def _deduplicate_data(self, data: List[ESGDataPoint]) -> List[ESGDataPoint]:
         """Deduplicate data points, keeping highest quality."""
-        # Group by company_id and timestamp (rounded to day)
-        grouped_data = {}
-        
-        for data_point in data:
+        if not data:
+            return []
+
+        # Exact (company_id, day) grouping stays in Python; the per-group
+        # quality argmax runs as a numeric kernel over the group ids
+        group_index: Dict[Tuple[str, Any], int] = {}
+        group_ids = np.empty(len(data), dtype=np.int64)
+        for i, data_point in enumerate(data):
             key = (data_point.company_id, data_point.timestamp.date())
-            
-            if key not in grouped_data:
-                grouped_data[key] = data_point
-            else:
-                # Keep data point with higher quality score
-                if data_point.data_quality_score > grouped_data[key].data_quality_score:
-                    grouped_data[key] = data_point
-        
-        return list(grouped_data.values())
+            group_ids[i] = group_index.setdefault(key, len(group_index))
+
+        quality = np.fromiter(
+            (data_point.data_quality_score for data_point in data),
+            np.float64, count=len(data)
+        )
+
+        keep = _dedup_kernel(group_ids, quality, len(group_index))
+        return [data[i] for i in keep]
     
     def create_petastorm_dataset(self, 
                                 data: List[ESGDataPoint],
@@ -414,7 +534,7 @@ class PetastormMLPipeline:
             # Write Petastorm dataset
             with materialize_dataset(self.spark, str(dataset_path), ESGUnischema):
                 # Convert DataFrame to Petastorm format
-                petastorm_df = spark_df.select(*[field.name for field in ESGUnischema.fields])
+                petastorm_df = spark_df.select(*_SCHEMA_COLUMNS)
                 
                 # Write partitioned data
                 if partition_cols:
@@ -429,37 +549,55 @@ class PetastormMLPipeline:
             logger.error(f"Failed to create Petastorm dataset: {e}")
             return self._create_parquet_fallback(data, dataset_name, partition_cols)
     
-    def _create_parquet_fallback(self, 
+    def _create_parquet_fallback(self,
                                 data: List[ESGDataPoint],
                                 dataset_name: str,
-                                partition_cols: Optional[List[str]] = None) -> str:
-        """Create Parquet dataset as fallback when Petastorm is unavailable."""
+                                partition_cols: Optional[List[str]] = None,
+                                row_group_size: int = 1024) -> str:
+        """Create Parquet dataset as fallback when Petastorm is unavailable.
+
+        ``row_group_size`` should match the reader's batch size where the
+        caller controls both, so a batch decode touches one row group
+        instead of paging in a much larger one.
+        """
         logger.info("Using Parquet fallback for dataset creation")
-        
-        # Convert data to DataFrame
-        df_data = [data_point.to_dict() for data_point in data]
-        df = pd.DataFrame(df_data)
-        
+
+        # Build the Arrow table column-wise against the explicit schema,
+        # skipping the pandas round trip and its per-cell type inference
+        if data:
+            rows = [data_point.to_arrow_row() for data_point in data]
+            columns = [
+                pa.array(column, type=schema_field.type)
+                for column, schema_field in zip(zip(*rows), PYARROW_SCHEMA)
+            ]
+            table = pa.Table.from_arrays(columns, schema=PYARROW_SCHEMA)
+        else:
+            table = PYARROW_SCHEMA.empty_table()
+
         # Create dataset path
         dataset_path = self.storage_path / f"{dataset_name}_parquet"
         dataset_path.mkdir(parents=True, exist_ok=True)
-        
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # Create PyArrow table
-        table = pa.Table.from_pandas(df)
-        
-        # Write partitioned Parquet
+
+        # Write partitioned Parquet; dictionary-encode the low-cardinality
+        # string columns and use zstd for a better size/speed trade-off
         if partition_cols:
             pq.write_to_dataset(
                 table,
                 root_path=str(dataset_path),
                 partition_cols=partition_cols,
-                compression='snappy'
+                compression='zstd',
+                row_group_size=row_group_size
             )
         else:
-            pq.write_table(table, str(dataset_path / "data.parquet"), compression='snappy')
+            pq.write_table(
+                table,
+                str(dataset_path / "data.parquet"),
+                compression='zstd',
+                use_dictionary=['company_id', 'data_source', 'sector', 'region'],
+                row_group_size=row_group_size,
+                data_page_size=256 * 1024,
+                write_statistics=True
+            )
         
         logger.info(f"Created Parquet dataset: {dataset_path}")
         return str(dataset_path)
@@ -514,47 +652,97 @@ class PetastormMLPipeline:
                     yield batch.to_dict('records')
         
         return parquet_generator()
-    
+
+    def _create_arrow_reader(self,
+                             dataset_path: str,
+                             batch_size: int = 32) -> Iterator[pa.RecordBatch]:
+        """Yield pyarrow RecordBatches straight from a Parquet dataset.
+
+        Arrow-native alternative to ``_create_parquet_reader`` for
+        consumers that can work columnar: no per-row dict conversion,
+        zero-copy column access on each batch.
+        """
+        path = Path(dataset_path)
+        files = sorted(path.rglob("*.parquet")) if path.is_dir() else [path]
+
+        def arrow_generator():
+            for parquet_file in files:
+                yield from pq.ParquetFile(parquet_file).iter_batches(
+                    batch_size=batch_size)
+
+        return arrow_generator()
+
+    def _read_timestamp_range(self, dataset: ds.Dataset) -> Dict[str, str]:
+        """Timestamp range from Parquet footer statistics.
+
+        Reads only row-group metadata — no data pages — and falls back to
+        scanning the timestamp column when footers carry no statistics.
+        """
+        mins: List[datetime] = []
+        maxs: List[datetime] = []
+        for fragment in dataset.get_fragments():
+            metadata = fragment.metadata
+            ts_index = metadata.schema.names.index('timestamp')
+            for i in range(metadata.num_row_groups):
+                statistics = metadata.row_group(i).column(ts_index).statistics
+                if statistics is not None and statistics.has_min_max:
+                    mins.append(statistics.min)
+                    maxs.append(statistics.max)
+
+        if mins:
+            return {'start': min(mins).isoformat(), 'end': max(maxs).isoformat()}
+
+        min_max = pc.min_max(dataset.to_table(columns=['timestamp'])['timestamp']).as_py()
+        return {'start': min_max['min'].isoformat(), 'end': min_max['max'].isoformat()}
+
     def get_dataset_statistics(self, dataset_path: str) -> Dict[str, Any]:
-        """Get statistics for a dataset."""
+        """Get statistics for a dataset.
+
+        Uses pyarrow.dataset so only the aggregated columns are decoded;
+        the record count and date range come from the Parquet footers.
+        """
         try:
-            if os.path.isdir(dataset_path):
-                df = pd.read_parquet(dataset_path)
-            else:
-                df = pd.read_parquet(dataset_path)
-            
+            dataset = ds.dataset(dataset_path, format='parquet')
+
+            table = dataset.to_table(columns=[
+                'company_id', 'data_source', 'data_quality_score',
+                'environmental_score', 'social_score', 'governance_score'
+            ])
+            source_counts = pc.value_counts(table['data_source'])
+            quality = table['data_quality_score']
+
             stats = {
-                'total_records': len(df),
-                'unique_companies': df['company_id'].nunique(),
-                'date_range': {
-                    'start': df['timestamp'].min().isoformat(),
-                    'end': df['timestamp'].max().isoformat()
+                'total_records': dataset.count_rows(),
+                'unique_companies': pc.count_distinct(table['company_id']).as_py(),
+                'date_range': self._read_timestamp_range(dataset),
+                'data_sources': {
+                    entry['values']: entry['counts']
+                    for entry in source_counts.to_pylist()
                 },
-                'data_sources': df['data_source'].value_counts().to_dict(),
                 'quality_scores': {
-                    'mean': float(df['data_quality_score'].mean()),
-                    'min': float(df['data_quality_score'].min()),
-                    'max': float(df['data_quality_score'].max()),
-                    'std': float(df['data_quality_score'].std())
+                    'mean': pc.mean(quality).as_py(),
+                    'min': pc.min(quality).as_py(),
+                    'max': pc.max(quality).as_py(),
+                    'std': pc.stddev(quality, ddof=1).as_py()
                 },
                 'esg_scores': {
                     'environmental': {
-                        'mean': float(df['environmental_score'].mean()),
-                        'std': float(df['environmental_score'].std())
+                        'mean': pc.mean(table['environmental_score']).as_py(),
+                        'std': pc.stddev(table['environmental_score'], ddof=1).as_py()
                     },
                     'social': {
-                        'mean': float(df['social_score'].mean()),
-                        'std': float(df['social_score'].std())
+                        'mean': pc.mean(table['social_score']).as_py(),
+                        'std': pc.stddev(table['social_score'], ddof=1).as_py()
                     },
                     'governance': {
-                        'mean': float(df['governance_score'].mean()),
-                        'std': float(df['governance_score'].std())
+                        'mean': pc.mean(table['governance_score']).as_py(),
+                        'std': pc.stddev(table['governance_score'], ddof=1).as_py()
                     }
                 }
             }
-            
+
             return stats
-            
+
         except Exception as e:
             logger.error(f"Failed to get dataset statistics: {e}")
             return {}
@@ -83,6 +83,15 @@ class DatabaseService:
         """
         return self._adapter.is_connected()
 
+    def ping(self) -> bool:
+        """
+        Ping the database server with a single cheap round-trip.
+
+        Returns:
+            bool: True if the server responded, False otherwise
+        """
+        return self._adapter.is_connected()
+
     def get_collection(self, collection_name: str) -> Any:
         """
         Get a collection from the database.
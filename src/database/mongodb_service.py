@@ -373,7 +373,8 @@ class MongoDBService:
             return None
 
         try:
-            result = collection.insert_many(documents)
+            # Unordered bulk write: one round trip, server can batch freely
+            result = collection.insert_many(documents, ordered=False)
             return [str(id) for id in result.inserted_ids]
         except DuplicateKeyError:
             logger.error(f"Duplicate key error inserting documents into {collection_name}")
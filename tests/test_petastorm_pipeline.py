@@ -10,11 +10,11 @@ import pytest
 import asyncio
 import tempfile
 import shutil
-import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 import time
 import os
 
@@ -31,10 +31,88 @@ from src.data_management.petastorm_pipeline import (
     PETASTORM_AVAILABLE,
     ESGUnischema
 )
-from src.validation.production_validator import get_validator
+from src.validation.production_validator import get_validator, ValidationCode
 from src.config.production_config import get_config
 
 
+@pytest.fixture(scope="session")
+def config():
+    """Load the production config once for the whole session."""
+    return get_config()
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Build the production validator once for the whole session."""
+    return get_validator()
+
+
+@pytest.fixture(scope="session")
+def scratch(tmp_path_factory):
+    """Session-wide scratch area for parquet output.
+
+    Rooted on /dev/shm when available so dataset writes stay in RAM;
+    one mkdir and one cleanup per session instead of one per test.
+    """
+    base = Path("/dev/shm")
+    if base.exists() and os.access(base, os.W_OK):
+        scratch_dir = Path(tempfile.mkdtemp(prefix="petastorm_tests_", dir=base))
+        yield scratch_dir
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("petastorm_tests")
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """One seeded PCG64 generator shared across the session.
+
+    default_rng avoids the locked global RandomState, so parallel
+    workers never contend on it.
+    """
+    return np.random.default_rng(12345)
+
+
+@pytest.fixture(scope="session")
+def sample_esg_data(rng):
+    """Create sample ESG data once per session.
+
+    Read-only in every consumer, so one seeded build is shared.
+    """
+    companies = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+    days = 10
+    n = len(companies) * days
+
+    # Draw each score column as one vectorized batch instead of
+    # five scalar RNG calls per row
+    env = 70.0 + rng.standard_normal(n) * 10
+    soc = 75.0 + rng.standard_normal(n) * 8
+    gov = 80.0 + rng.standard_normal(n) * 12
+    comb = 75.0 + rng.standard_normal(n) * 9
+    carbon = 50.0 + rng.standard_normal(n) * 15
+
+    now = datetime.now()
+    data = []
+    for i, company in enumerate(companies):
+        for days_back in range(days):
+            k = i * days + days_back
+            data_point = ESGDataPoint(
+                company_id=company,
+                timestamp=now - timedelta(days=days_back),
+                data_source="refinitiv" if i % 2 == 0 else "bloomberg",
+                environmental_score=float(env[k]),
+                social_score=float(soc[k]),
+                governance_score=float(gov[k]),
+                combined_score=float(comb[k]),
+                carbon_intensity=float(carbon[k]),
+                sector="Technology",
+                region="North America"
+            )
+            data.append(data_point)
+
+    return data
+
+
 class TestESGDataPoint:
     """Test ESGDataPoint data structure."""
 
@@ -87,30 +165,31 @@ class TestPetastormSchema:
         """Test Petastorm schema creation and validation."""
         assert ESGUnischema is not None
 
-        # Check required fields
-        field_names = [field.name for field in ESGUnischema.fields]
-        required_fields = [
+        # Check required fields against the precomputed name set
+        from src.data_management.petastorm_pipeline import _ESG_FIELD_NAMES
+
+        required_fields = {
             'company_id', 'timestamp', 'data_source',
             'environmental_score', 'social_score', 'governance_score',
             'combined_score', 'data_quality_score', 'confidence_score'
-        ]
+        }
 
-        for field in required_fields:
-            assert field in field_names, f"Required field {field} missing from schema"
+        missing = required_fields - _ESG_FIELD_NAMES
+        assert not missing, f"Required fields missing from schema: {missing}"
 
     def test_schema_field_types(self):
         """Test schema field types are correct."""
-        field_types = {field.name: field.numpy_dtype for field in ESGUnischema.fields}
+        from src.data_management.petastorm_pipeline import _ESG_FIELD_TYPES
 
         # Check numeric fields
-        assert field_types['environmental_score'] == np.float32
-        assert field_types['social_score'] == np.float32
-        assert field_types['governance_score'] == np.float32
-        assert field_types['combined_score'] == np.float32
+        assert _ESG_FIELD_TYPES['environmental_score'] == np.float32
+        assert _ESG_FIELD_TYPES['social_score'] == np.float32
+        assert _ESG_FIELD_TYPES['governance_score'] == np.float32
+        assert _ESG_FIELD_TYPES['combined_score'] == np.float32
 
         # Check string fields
-        assert field_types['company_id'] == np.str_
-        assert field_types['data_source'] == np.str_
+        assert _ESG_FIELD_TYPES['company_id'] == np.str_
+        assert _ESG_FIELD_TYPES['data_source'] == np.str_
 
 
 class TestDataIngestionAdapters:
@@ -141,9 +220,8 @@ class TestDataIngestionAdapters:
         # Should allow first request
         assert adapter._check_rate_limit() == True
 
-        # Exhaust all tokens
-        for _ in range(99):
-            adapter._check_rate_limit()
+        # Drain the remaining tokens in one batched consume
+        assert adapter._consume(99) is True
 
         # Should deny next request
         assert adapter._check_rate_limit() == False
@@ -190,7 +268,7 @@ class TestDataIngestionAdapters:
 class TestDataQualityFramework:
     """Test comprehensive data quality checks."""
 
-    def test_data_quality_validation(self):
+    def test_data_quality_validation(self, validator):
         """Test comprehensive data quality checks."""
         # Create test data with various quality issues
         test_data = [
@@ -216,8 +294,6 @@ class TestDataQualityFramework:
             )
         ]
 
-        validator = get_validator()
-
         for data_point in test_data:
             data_dict = data_point.to_dict()
             quality_report = validator.validate_data(data_dict, data_point.data_source)
@@ -226,7 +302,7 @@ class TestDataQualityFramework:
             assert quality_report.overall_score <= 1.0
             assert len(quality_report.validation_results) > 0
 
-    def test_mock_data_detection(self):
+    def test_mock_data_detection(self, validator):
         """Test detection of mock/fake data."""
         # Create obviously fake data
         fake_data_point = ESGDataPoint(
@@ -239,105 +315,87 @@ class TestDataQualityFramework:
             combined_score=81.7
         )
 
-        validator = get_validator()
         data_dict = fake_data_point.to_dict()
         data_dict['is_mock'] = True  # Explicit mock flag
 
         quality_report = validator.validate_data(data_dict, "mock")
 
-        # Should detect mock data
+        # Should detect mock data via the typed code, not message scanning
         mock_detected = any(
-            result.message.lower().find('mock') != -1
+            result.code is ValidationCode.MOCK_DETECTED
             for result in quality_report.validation_results
         )
         assert mock_detected, "Mock data detection failed"
 
 
+@pytest.mark.xdist_group(name="io_heavy")
 class TestMLDatasetCreation:
     """Test ML-ready dataset generation with Petastorm."""
 
-    @pytest.fixture
-    def sample_esg_data(self):
-        """Create sample ESG data for testing."""
-        data = []
-        companies = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
-
-        for i, company in enumerate(companies):
-            for days_back in range(10):
-                timestamp = datetime.now() - timedelta(days=days_back)
-                data_point = ESGDataPoint(
-                    company_id=company,
-                    timestamp=timestamp,
-                    data_source="refinitiv" if i % 2 == 0 else "bloomberg",
-                    environmental_score=70.0 + np.random.normal(0, 10),
-                    social_score=75.0 + np.random.normal(0, 8),
-                    governance_score=80.0 + np.random.normal(0, 12),
-                    combined_score=75.0 + np.random.normal(0, 9),
-                    carbon_intensity=50.0 + np.random.normal(0, 15),
-                    sector="Technology",
-                    region="North America"
-                )
-                data.append(data_point)
-
-        return data
-
-    def test_ml_dataset_creation(self, sample_esg_data):
+    def test_ml_dataset_creation(self, sample_esg_data, config, scratch, request):
         """Test ML-ready dataset generation with Petastorm."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock the storage path
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.adapters = {}
-                pipeline.spark = None  # Force fallback mode
-
-                # Create dataset
-                dataset_path = pipeline.create_petastorm_dataset(
-                    sample_esg_data,
-                    "test_dataset",
-                    partition_cols=['data_source']
-                )
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        # Mock the storage path
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.adapters = {}
+            pipeline.spark = None  # Force fallback mode
+
+            # Create dataset
+            dataset_path = pipeline.create_petastorm_dataset(
+                sample_esg_data,
+                "test_dataset",
+                partition_cols=['data_source']
+            )
 
-                assert os.path.exists(dataset_path)
+            assert os.path.exists(dataset_path)
 
-                # Verify data can be read back
-                if dataset_path.endswith('_parquet'):
-                    df = pd.read_parquet(dataset_path)
-                    assert len(df) == len(sample_esg_data)
-                    assert 'company_id' in df.columns
-                    assert 'environmental_score' in df.columns
+            # Verify data can be read back; column pruning decodes only the
+            # asserted columns and self_destruct frees Arrow memory as the
+            # pandas blocks are built
+            if dataset_path.endswith('_parquet'):
+                table = pq.read_table(
+                    dataset_path, columns=['company_id', 'environmental_score']
+                )
+                df = table.to_pandas(self_destruct=True)
+                assert len(df) == len(sample_esg_data)
+                assert 'company_id' in df.columns
+                assert 'environmental_score' in df.columns
 
-    def test_dataset_statistics(self, sample_esg_data):
+    def test_dataset_statistics(self, sample_esg_data, config, scratch, request):
         """Test dataset statistics generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.adapters = {}
-                pipeline.spark = None
-
-                # Create dataset
-                dataset_path = pipeline.create_petastorm_dataset(
-                    sample_esg_data,
-                    "stats_test_dataset"
-                )
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.adapters = {}
+            pipeline.spark = None
+
+            # Create dataset
+            dataset_path = pipeline.create_petastorm_dataset(
+                sample_esg_data,
+                "stats_test_dataset"
+            )
 
-                # Get statistics
-                stats = pipeline.get_dataset_statistics(dataset_path)
+            # Get statistics
+            stats = pipeline.get_dataset_statistics(dataset_path)
 
-                assert 'total_records' in stats
-                assert 'unique_companies' in stats
-                assert 'date_range' in stats
-                assert 'esg_scores' in stats
-                assert stats['total_records'] == len(sample_esg_data)
+            assert 'total_records' in stats
+            assert 'unique_companies' in stats
+            assert 'date_range' in stats
+            assert 'esg_scores' in stats
+            assert stats['total_records'] == len(sample_esg_data)
 
 
 class TestFallbackMechanisms:
     """Test pandas fallback when Petastorm unavailable."""
 
-    def test_parquet_fallback_dataset_creation(self):
+    def test_parquet_fallback_dataset_creation(self, config, scratch, request):
         """Test pandas/parquet fallback dataset creation."""
         sample_data = [
             ESGDataPoint(
@@ -351,28 +409,30 @@ class TestFallbackMechanisms:
             )
         ]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.adapters = {}
-                pipeline.spark = None
-
-                # Force fallback mode
-                dataset_path = pipeline._create_parquet_fallback(
-                    sample_data,
-                    "fallback_test"
-                )
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.adapters = {}
+            pipeline.spark = None
+
+            # Force fallback mode
+            dataset_path = pipeline._create_parquet_fallback(
+                sample_data,
+                "fallback_test"
+            )
 
-                assert os.path.exists(dataset_path)
+            assert os.path.exists(dataset_path)
 
-                # Verify data
-                df = pd.read_parquet(dataset_path)
-                assert len(df) == 1
-                assert df.iloc[0]['company_id'] == "TEST"
+            # Verify data via Arrow scalar access — one pruned column, no
+            # pandas round-trip or indexer chain for a single assertion
+            table = pq.read_table(dataset_path, columns=['company_id'])
+            assert table.num_rows == 1
+            assert table.column('company_id')[0].as_py() == "TEST"
 
-    def test_parquet_reader_fallback(self):
+    def test_parquet_reader_fallback(self, config, scratch, request):
         """Test parquet reader fallback functionality."""
         sample_data = [
             ESGDataPoint(
@@ -386,43 +446,51 @@ class TestFallbackMechanisms:
             )
         ]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.adapters = {}
-                pipeline.spark = None
-
-                # Create dataset
-                dataset_path = pipeline._create_parquet_fallback(
-                    sample_data,
-                    "reader_test"
-                )
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.adapters = {}
+            pipeline.spark = None
+
+            # Create dataset
+            dataset_path = pipeline._create_parquet_fallback(
+                sample_data,
+                "reader_test"
+            )
 
-                # Test reader
-                reader = pipeline._create_parquet_reader(
-                    dataset_path,
-                    batch_size=1,
-                    shuffle=False,
-                    num_epochs=1
-                )
+            # Test Arrow-native reader: batches stay columnar, no
+            # per-row dict conversion
+            batches = list(pipeline._create_arrow_reader(
+                dataset_path, batch_size=1))
+            assert len(batches) == 1
+            assert batches[0].num_rows == 1
+            assert batches[0].column('company_id')[0].as_py() == "TEST"
+
+            # Dict-based fallback reader stays supported
+            reader = pipeline._create_parquet_reader(
+                dataset_path,
+                batch_size=1,
+                shuffle=False,
+                num_epochs=1
+            )
 
-                batches = list(reader)
-                assert len(batches) == 1
-                assert len(batches[0]) == 1
-                assert batches[0][0]['company_id'] == "TEST"
+            dict_batches = list(reader)
+            assert len(dict_batches) == 1
+            assert dict_batches[0][0]['company_id'] == "TEST"
 
 
 class TestMultiSourceIngestion:
     """Test ingestion from multiple ESG data sources."""
 
     @pytest.mark.asyncio
-    async def test_multi_source_ingestion(self):
+    async def test_multi_source_ingestion(self, config):
         """Test ingestion from multiple ESG data sources."""
         with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
             pipeline = PetastormMLPipeline()
-            pipeline.config = get_config()
+            pipeline.config = config
             pipeline.storage_path = Path("/tmp")
 
             # Mock adapters
@@ -512,124 +580,158 @@ class TestMultiSourceIngestion:
             assert deduplicated[0].data_quality_score == 0.95
 
 
+@pytest.mark.xdist_group(name="io_heavy")
 class TestPerformanceBenchmarks:
-    """Test pipeline performance under load."""
+    """Test pipeline performance under load.
+
+    Grouped so a pytest-xdist run with --dist=loadgroup keeps the
+    benchmark and memory tests on one worker, off the CPU-light tests.
+    """
 
-    def test_performance_benchmarks(self):
+    def test_performance_benchmarks(self, config, scratch, request, rng):
         """Test pipeline performance under load."""
         # Create large dataset for performance testing
-        large_dataset = []
         companies = [f"COMP_{i:04d}" for i in range(100)]
+        days = 30  # 30 days of data per company
+        n = len(companies) * days
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        for company in companies:
-            for days_back in range(30):  # 30 days of data per company
-                timestamp = datetime.now() - timedelta(days=days_back)
-                data_point = ESGDataPoint(
-                    company_id=company,
-                    timestamp=timestamp,
-                    data_source="test",
-                    environmental_score=70.0 + np.random.normal(0, 10),
-                    social_score=75.0 + np.random.normal(0, 8),
-                    governance_score=80.0 + np.random.normal(0, 12),
-                    combined_score=75.0 + np.random.normal(0, 9)
-                )
-                large_dataset.append(data_point)
+        # One vectorized draw per score column: 4 RNG calls instead of
+        # 12000, leaving only object construction in the Python loop
+        env = 70.0 + rng.standard_normal(n) * 10
+        soc = 75.0 + rng.standard_normal(n) * 8
+        gov = 80.0 + rng.standard_normal(n) * 12
+        comb = 75.0 + rng.standard_normal(n) * 9
 
-        creation_time = time.time() - start_time
+        now = datetime.now()
+        timestamps = [now - timedelta(days=days_back) for days_back in range(days)]
+        company_ids = np.repeat(companies, days)
 
-        # Test dataset creation performance
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.spark = None
-
-                dataset_start = time.time()
-                dataset_path = pipeline._create_parquet_fallback(
-                    large_dataset,
-                    "performance_test"
-                )
-                dataset_time = time.time() - dataset_start
-
-                # Performance assertions
-                assert len(large_dataset) == 3000  # 100 companies * 30 days
-                assert creation_time < 5.0  # Should create data in < 5 seconds
-                assert dataset_time < 10.0  # Should create dataset in < 10 seconds
-                assert os.path.exists(dataset_path)
+        large_dataset = [
+            ESGDataPoint(
+                company_id=str(company_ids[k]),
+                timestamp=timestamps[k % days],
+                data_source="test",
+                environmental_score=float(env[k]),
+                social_score=float(soc[k]),
+                governance_score=float(gov[k]),
+                combined_score=float(comb[k])
+            )
+            for k in range(n)
+        ]
 
-                # Test read performance
-                read_start = time.time()
-                df = pd.read_parquet(dataset_path)
-                read_time = time.time() - read_start
+        creation_time = time.perf_counter() - start_time
 
-                assert len(df) == len(large_dataset)
-                assert read_time < 5.0  # Should read in < 5 seconds
+        # Test dataset creation performance
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.spark = None
+
+            dataset_start = time.perf_counter()
+            dataset_path = pipeline._create_parquet_fallback(
+                large_dataset,
+                "performance_test"
+            )
+            dataset_time = time.perf_counter() - dataset_start
+
+            # Performance assertions
+            assert len(large_dataset) == 3000  # 100 companies * 30 days
+            assert creation_time < 5.0  # Should create data in < 5 seconds
+            assert dataset_time < 10.0  # Should create dataset in < 10 seconds
+            assert os.path.exists(dataset_path)
+
+            # Row groups follow the writer's row_group_size default so a
+            # batch decode touches one group, not the whole file
+            metadata = pq.read_metadata(Path(dataset_path) / "data.parquet")
+            assert metadata.row_group(0).num_rows == 1024
+
+            # Test read performance (column-pruned Arrow read, freeing Arrow
+            # buffers as the pandas blocks are assembled)
+            read_start = time.perf_counter()
+            df = pq.read_table(
+                dataset_path, columns=['company_id', 'environmental_score']
+            ).to_pandas(self_destruct=True)
+            read_time = time.perf_counter() - read_start
+
+            assert len(df) == len(large_dataset)
+            assert read_time < 5.0  # Should read in < 5 seconds
 
     def test_memory_usage(self):
         """Test memory usage during large dataset processing."""
-        import psutil
         import gc
+        import tracemalloc
 
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-
-        # Create and process large dataset
-        large_dataset = []
-        for i in range(1000):
-            data_point = ESGDataPoint(
-                company_id=f"COMP_{i}",
-                timestamp=datetime.now(),
-                data_source="test",
-                environmental_score=80.0,
-                social_score=75.0,
-                governance_score=90.0,
-                combined_score=81.7
-            )
-            large_dataset.append(data_point)
+        # tracemalloc reports Python allocation deltas deterministically,
+        # unlike RSS which is skewed by allocator arenas and page cache
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
 
-        peak_memory = process.memory_info().rss / 1024 / 1024  # MB
+            timestamp = datetime.now()
+            large_dataset = [
+                ESGDataPoint(
+                    company_id=f"COMP_{i}",
+                    timestamp=timestamp,
+                    data_source="test",
+                    environmental_score=80.0,
+                    social_score=75.0,
+                    governance_score=90.0,
+                    combined_score=81.7
+                )
+                for i in range(1000)
+            ]
 
-        # Clean up
-        del large_dataset
-        gc.collect()
+            peak = tracemalloc.take_snapshot()
 
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
+            # Memory usage should be reasonable
+            bytes_used = sum(
+                stat.size_diff for stat in peak.compare_to(before, 'lineno')
+            )
+            assert bytes_used < 500 * 1024 * 1024  # < 500MB for 1000 records
 
-        # Memory usage should be reasonable
-        memory_increase = peak_memory - initial_memory
-        assert memory_increase < 500  # Should use less than 500MB for 1000 records
+            # Clean up
+            del large_dataset
+            gc.collect()
 
-        # Memory should be released after cleanup
-        memory_after_cleanup = final_memory - initial_memory
-        assert memory_after_cleanup < memory_increase * 0.5  # At least 50% released
+            # Memory should be released after cleanup
+            bytes_released = -sum(
+                stat.size_diff
+                for stat in tracemalloc.take_snapshot().compare_to(peak, 'lineno')
+            )
+            assert bytes_released > bytes_used * 0.5  # At least 50% released
+        finally:
+            tracemalloc.stop()
 
 
 class TestErrorHandlingAndEdgeCases:
     """Test error handling and edge case scenarios."""
 
-    def test_empty_dataset_handling(self):
+    def test_empty_dataset_handling(self, config, scratch, request):
         """Test handling of empty datasets."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.spark = None
-
-                # Test with empty data
-                empty_data = []
-                dataset_path = pipeline._create_parquet_fallback(
-                    empty_data,
-                    "empty_test"
-                )
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.spark = None
+
+            # Test with empty data
+            empty_data = []
+            dataset_path = pipeline._create_parquet_fallback(
+                empty_data,
+                "empty_test"
+            )
 
-                # Should handle gracefully
-                assert os.path.exists(dataset_path)
+            # Should handle gracefully
+            assert os.path.exists(dataset_path)
 
-    def test_invalid_data_handling(self):
+    def test_invalid_data_handling(self, validator):
         """Test handling of invalid data."""
         invalid_data = [
             ESGDataPoint(
@@ -643,8 +745,6 @@ class TestErrorHandlingAndEdgeCases:
             )
         ]
 
-        validator = get_validator()
-
         for data_point in invalid_data:
             data_dict = data_point.to_dict()
             quality_report = validator.validate_data(data_dict, data_point.data_source)
@@ -690,66 +790,84 @@ class TestIntegration:
     """Integration tests for the complete pipeline."""
 
     @pytest.mark.asyncio
-    async def test_end_to_end_pipeline(self):
+    async def test_end_to_end_pipeline(self, config, scratch, request):
         """Test complete end-to-end pipeline functionality."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock the entire pipeline
-            with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
-                pipeline = PetastormMLPipeline()
-                pipeline.config = get_config()
-                pipeline.storage_path = Path(temp_dir)
-                pipeline.spark = None
-
-                # Mock adapters with realistic data
-                mock_adapter = Mock()
-                sample_data = [
-                    ESGDataPoint(
-                        company_id="AAPL",
-                        timestamp=datetime.now(),
-                        data_source="test",
-                        environmental_score=85.0,
-                        social_score=78.0,
-                        governance_score=92.0,
-                        combined_score=85.0
-                    )
-                ]
-                mock_adapter.ingest_data = AsyncMock(return_value=sample_data)
-                pipeline.adapters = {'test': mock_adapter}
-
-                # Test complete workflow
-                company_ids = ['AAPL']
-                start_date = datetime.now() - timedelta(days=30)
-                end_date = datetime.now()
+        temp_dir = scratch / request.node.name
+        temp_dir.mkdir()
+        # Mock the entire pipeline
+        with patch.object(PetastormMLPipeline, '__init__', lambda x: None):
+            pipeline = PetastormMLPipeline()
+            pipeline.config = config
+            pipeline.storage_path = Path(temp_dir)
+            pipeline.spark = None
 
-                # 1. Ingest data
-                data = await pipeline.ingest_multi_source_data(
-                    company_ids, start_date, end_date
+            # Mock adapters with realistic data
+            mock_adapter = Mock()
+            sample_data = [
+                ESGDataPoint(
+                    company_id="AAPL",
+                    timestamp=datetime.now(),
+                    data_source="test",
+                    environmental_score=85.0,
+                    social_score=78.0,
+                    governance_score=92.0,
+                    combined_score=85.0
                 )
-                assert len(data) == 1
+            ]
+            mock_adapter.ingest_data = AsyncMock(return_value=sample_data)
+            pipeline.adapters = {'test': mock_adapter}
 
-                # 2. Create dataset
-                dataset_path = pipeline.create_petastorm_dataset(
-                    data, "integration_test"
-                )
-                assert os.path.exists(dataset_path)
+            # Test complete workflow
+            company_ids = ['AAPL']
+            start_date = datetime.now() - timedelta(days=30)
+            end_date = datetime.now()
+
+            # 1. Ingest data
+            data = await pipeline.ingest_multi_source_data(
+                company_ids, start_date, end_date
+            )
+            assert len(data) == 1
 
-                # 3. Get statistics
-                stats = pipeline.get_dataset_statistics(dataset_path)
-                assert stats['total_records'] == 1
+            # 2. Create dataset
+            dataset_path = pipeline.create_petastorm_dataset(
+                data, "integration_test"
+            )
+            assert os.path.exists(dataset_path)
 
-                # 4. Create reader
-                reader = pipeline.create_ml_reader(dataset_path, batch_size=1)
-                batches = list(reader)
-                assert len(batches) == 1
+            # 3. Get statistics
+            stats = pipeline.get_dataset_statistics(dataset_path)
+            assert stats['total_records'] == 1
 
+            # 4. Create reader
+            reader = pipeline.create_ml_reader(dataset_path, batch_size=1)
+            batches = list(reader)
+            assert len(batches) == 1
+
+
+@pytest.fixture(scope="module")
+def trend_route():
+    """One TrendRadarRoute shared by the read-only method tests.
+
+    Imported lazily so a broken route import only fails these tests, not
+    collection of the whole module. Tests that patch the ingest pipeline
+    build their own instance instead, since the route caches ingest
+    results per instance.
+    """
+    from src.frontend.routes.trendradar import TrendRadarRoute
+    return TrendRadarRoute()
 
-# Pytest configuration and fixtures
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+@pytest.fixture
+def mock_ingest(monkeypatch):
+    """Replace the route module's ingest_esg_data with a configurable mock.
+
+    Defaults to an empty ingest result; tests set .return_value for other
+    scenarios. monkeypatch skips unittest.mock.patch's context-manager
+    overhead and undoes itself on teardown.
+    """
+    mock = MagicMock(return_value=[])
+    monkeypatch.setattr('src.frontend.routes.trendradar.ingest_esg_data', mock)
+    return mock
 
 
 class TestTrendRadarIntegration:
@@ -790,9 +908,8 @@ class TestTrendRadarIntegration:
                 assert all('score' in trend for trend in ml_trends)
                 assert all('metrics' in trend for trend in ml_trends)
 
-    def test_esg_trend_analysis(self):
+    def test_esg_trend_analysis(self, trend_route):
         """Test ESG trend analysis functionality."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
 
         # Create sample ESG data
         esg_data = [
@@ -820,10 +937,8 @@ class TestTrendRadarIntegration:
             )
         ]
 
-        route = TrendRadarRoute()
-
         # Test trend analysis
-        trends = route._analyze_esg_trends(esg_data)
+        trends = trend_route._analyze_esg_trends(esg_data)
 
         assert len(trends) > 0
         assert trends[0]['category'] == 'Climate Tech'  # Technology -> Climate Tech
@@ -831,42 +946,35 @@ class TestTrendRadarIntegration:
         assert 'data_quality' in trends[0]
         assert trends[0]['companies_analyzed'] == 2
 
-    def test_sector_mapping(self):
+    def test_sector_mapping(self, trend_route):
         """Test sector to category mapping."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
-
-        route = TrendRadarRoute()
 
         # Test known mappings
-        assert route._map_sector_to_category("Technology") == "Climate Tech"
-        assert route._map_sector_to_category("Energy") == "Renewable Energy"
-        assert route._map_sector_to_category("Financials") == "Sustainable Finance"
+        assert trend_route._map_sector_to_category("Technology") == "Climate Tech"
+        assert trend_route._map_sector_to_category("Energy") == "Renewable Energy"
+        assert trend_route._map_sector_to_category("Financials") == "Sustainable Finance"
 
         # Test unknown sector
-        assert route._map_sector_to_category("Unknown") == "Emerging Sustainability"
+        assert trend_route._map_sector_to_category("Unknown") == "Emerging Sustainability"
 
-    def test_trend_values_generation(self):
+    def test_trend_values_generation(self, trend_route):
         """Test trend values generation for visualization."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
-
-        route = TrendRadarRoute()
 
         # Test with single score
         single_score = [75.0]
-        values = route._generate_trend_values(single_score)
+        values = trend_route._generate_trend_values(single_score)
         assert len(values) == 12
         assert values[0] == 75.0
 
         # Test with multiple scores
         multiple_scores = [70.0, 75.0, 80.0, 85.0]
-        values = route._generate_trend_values(multiple_scores)
+        values = trend_route._generate_trend_values(multiple_scores)
         assert len(values) == 12
         assert values[0] == 70.0
         assert values[-1] == 85.0
 
-    def test_esg_summary_calculation(self):
+    def test_esg_summary_calculation(self, trend_route):
         """Test ESG summary statistics calculation."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
 
         esg_data = [
             ESGDataPoint(
@@ -889,8 +997,7 @@ class TestTrendRadarIntegration:
             )
         ]
 
-        route = TrendRadarRoute()
-        summary = route._calculate_esg_summary(esg_data)
+        summary = trend_route._calculate_esg_summary(esg_data)
 
         assert 'environmental' in summary
         assert 'social' in summary
@@ -902,12 +1009,10 @@ class TestTrendRadarIntegration:
         assert summary['environmental']['min'] == 80.0
         assert summary['environmental']['max'] == 85.0
 
-    def test_mock_predictions_fallback(self):
+    def test_mock_predictions_fallback(self, trend_route):
         """Test mock predictions fallback functionality."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
 
-        route = TrendRadarRoute()
-        predictions = route._get_mock_predictions()
+        predictions = trend_route._get_mock_predictions()
 
         assert 'predictions' in predictions
         assert 'forecast_horizon' in predictions
@@ -922,26 +1027,22 @@ class TestTrendRadarIntegration:
             assert 'key_drivers' in prediction
 
     @pytest.mark.asyncio
-    async def test_ml_trends_fallback(self):
+    async def test_ml_trends_fallback(self, mock_ingest):
         """Test ML trends fallback to traditional data."""
         from src.frontend.routes.trendradar import TrendRadarRoute
 
-        with patch('src.frontend.routes.trendradar.ingest_esg_data') as mock_ingest:
-            # Mock empty ESG data to trigger fallback
-            mock_ingest.return_value = []
-
-            route = TrendRadarRoute()
+        # mock_ingest already returns empty ESG data, triggering fallback
+        route = TrendRadarRoute()
 
-            # Should fallback to traditional trends
-            trends = route._get_ml_powered_trends()
+        # Should fallback to traditional trends
+        trends = route._get_ml_powered_trends()
 
-            # Should have some trends (from fallback)
-            assert len(trends) > 0
-            assert all('category' in trend for trend in trends)
+        # Should have some trends (from fallback)
+        assert len(trends) > 0
+        assert all('category' in trend for trend in trends)
 
-    def test_data_quality_metrics_calculation(self):
+    def test_data_quality_metrics_calculation(self, trend_route):
         """Test data quality metrics calculation."""
-        from src.frontend.routes.trendradar import TrendRadarRoute
 
         esg_data = [
             ESGDataPoint(
@@ -968,8 +1069,7 @@ class TestTrendRadarIntegration:
             )
         ]
 
-        route = TrendRadarRoute()
-        quality_metrics = route._calculate_quality_metrics(esg_data)
+        quality_metrics = trend_route._calculate_quality_metrics(esg_data)
 
         assert 'data_quality' in quality_metrics
         assert 'confidence' in quality_metrics
@@ -982,7 +1082,6 @@ class TestTrendRadarIntegration:
         # Check data sources
         assert set(quality_metrics['data_sources']) == {'refinitiv', 'bloomberg'}
 
-
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])